@@ -0,0 +1,62 @@
+
+'''
+Compara el número de paquetes enviados al servidor por cada ciclo de control al establecer la velocidad
+de los motores de todos los robots ePuck de la escena, con y sin Client.batch()
+
+Antes de ejecutar este script, carga en el programa V-rep una escena con varios robots ePuck (por ejemplo
+"epuck_example2.ttt" en el directorio scenes/)
+Uso: python benchmarks/batch_writes.py [número de ciclos]
+'''
+
+from time import perf_counter, sleep
+import sys
+
+from vrep import Client
+import vrep_binds as binds
+
+
+def last_message_id(client):
+    '''
+    Devuelve el identificador del último paquete enviado al servidor. El cliente lo incrementa con cada paquete.
+    '''
+    code, message_id = binds.simxGetOutMessageInfo(client.get_id(), binds.simx_headeroffset_message_id)
+    return message_id
+
+
+def run(client, epucks, ticks, batched):
+    '''
+    Ejecuta ticks ciclos de control y devuelve el número medio de paquetes y el tiempo medio (en ms) por ciclo.
+    '''
+    start_message_id = last_message_id(client)
+    start = perf_counter()
+    for tick in range(0, ticks):
+        speed = 90 if tick % 2 == 0 else -90
+        if batched:
+            with client.batch():
+                for epuck in epucks:
+                    epuck.left_motor.speed = speed
+                    epuck.right_motor.speed = speed
+        else:
+            for epuck in epucks:
+                epuck.left_motor.speed = speed
+                epuck.right_motor.speed = speed
+        # Dejamos que el hilo de comunicaciones del cliente envíe los comandos
+        sleep(0.01)
+    elapsed = (perf_counter() - start) * 1000 / ticks
+    binds.simxGetPingTime(client.get_id())
+    packets = (last_message_id(client) - start_message_id) / ticks
+    return packets, elapsed
+
+
+if __name__ == '__main__':
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+
+    with Client('127.0.0.1:19997') as client:
+        simulation = client.simulation
+        scene = simulation.scene
+        epucks = list(scene.robots.epuck)
+
+        with simulation:
+            for batched in (False, True):
+                packets, elapsed = run(client, epucks, ticks, batched)
+                print('{} robots, batch={}: {:.2f} packets/tick, {:.2f}ms/tick'.format(len(epucks), batched, packets, elapsed))
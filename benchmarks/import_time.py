@@ -0,0 +1,73 @@
+
+'''
+Comprueba que el tiempo de importación de la librería está dentro del presupuesto documentado en el README
+(IMPORT_TIME_BUDGET milisegundos por encima del arranque de un intérprete vacío).
+Además comprueba que importar la librería no carga numpy, Pillow ni vectormath (solo se cargan la primera
+vez que se obtiene una imágen o se hace alguna operación con vectores o arrays), y que tampoco se carga numpy al
+codificar y enviar una llamada a un procedimiento remoto con argumentos simples (como la llamada a
+get_objects_info al crear el cliente). La llamada se envía con un identificador de cliente inválido, por lo que
+simxCallScriptFunction devuelve un error sin conectarse con el simulador.
+
+No necesita que el simulador V-rep esté en ejecución.
+Uso: python benchmarks/import_time.py [número de repeticiones]
+'''
+
+from os.path import dirname, abspath
+from statistics import median
+from time import perf_counter
+import subprocess
+import sys
+
+# Presupuesto de tiempo de importación (en milisegundos)
+IMPORT_TIME_BUDGET = 100
+
+ROOT = dirname(dirname(abspath(__file__)))
+
+MODULES = ['vrep_binds', 'vrep']
+HEAVY_MODULES = ['numpy', 'PIL', 'vectormath']
+
+# Codifica y envía una llamada a un procedimiento remoto (igual que RemoteMethodsProxy.RemoteMethod) y decodifica
+# una respuesta en JSON
+REMOTE_CALL_CODE = '''
+import sys, vrep, vrep_binds as binds
+from vrep import RemoteMethodsProxy
+signature, ints, floats, strings = RemoteMethodsProxy.encode_args((1, 0.5, True, 'light', [1, 2, 3], [0.5, 1.5], None))
+binds.simxCallScriptFunction(-1, 'ScriptHandler', binds.sim_scripttype_childscript, 'binary_proxy',
+                             ints, floats, ['get_objects_info', signature] + strings, bytearray(),
+                             binds.simx_opmode_blocking, returnArrays = 'numpy' in sys.modules)
+RemoteMethodsProxy.decode_results([], [], ['j', '[[[1, "ePuck", 0]]]'])
+sys.exit('numpy' in sys.modules)
+'''
+
+
+def run(code):
+    '''
+    Ejecuta el código indicado en un nuevo intérprete de Python y devuelve el tiempo que ha tardado (en milisegundos)
+    '''
+    start = perf_counter()
+    subprocess.check_call([sys.executable, '-c', code], cwd = ROOT)
+    return (perf_counter() - start) * 1000
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    baseline = median([run('pass') for i in range(0, repeats)])
+    failed = False
+
+    for module in MODULES:
+        elapsed = median([run('import {}'.format(module)) for i in range(0, repeats)]) - baseline
+        ok = elapsed <= IMPORT_TIME_BUDGET
+        failed = failed or not ok
+        print('import {}: {:.1f}ms (budget {}ms) {}'.format(module, elapsed, IMPORT_TIME_BUDGET, 'OK' if ok else 'FAILED'))
+
+    code = 'import sys, vrep; sys.exit(any(module in sys.modules for module in {}))'.format(HEAVY_MODULES)
+    ok = subprocess.call([sys.executable, '-c', code], cwd = ROOT) == 0
+    failed = failed or not ok
+    print('numpy, Pillow and vectormath not loaded on import: {}'.format('OK' if ok else 'FAILED'))
+
+    ok = subprocess.call([sys.executable, '-c', REMOTE_CALL_CODE], cwd = ROOT) == 0
+    failed = failed or not ok
+    print('numpy not loaded on remote method calls with plain arguments: {}'.format('OK' if ok else 'FAILED'))
+
+    sys.exit(1 if failed else 0)
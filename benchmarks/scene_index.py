@@ -0,0 +1,103 @@
+
+'''
+Mide la memoria y el tiempo de las consultas del índice de objetos de la escena (ObjectsProxy) para escenas
+con muchos objetos. Se compara con la representación anterior (un diccionario nombre -> identificador y otro
+nombre -> clase) y con objetos con __dict__ en vez de __slots__.
+
+No necesita que el simulador V-rep esté en ejecución: la información de los objetos se genera aleatoriamente.
+Uso: python benchmarks/scene_index.py [número de objetos]
+'''
+
+from time import perf_counter
+import tracemalloc
+import random
+import sys
+
+from vrep import ObjectsProxy
+from vrep_objects import *
+import vrep_binds as binds
+
+
+OBJECT_TYPES = [binds.sim_object_shape_type, binds.sim_object_proximitysensor_type, binds.sim_object_visionsensor_type,
+                binds.sim_joint_revolute_subtype, binds.sim_joint_prismatic_subtype]
+
+
+class OfflineClient:
+    '''
+    Cliente sin conexión con el simulador (la escena nunca cambia y no hay caché en disco)
+    '''
+    scene_cache = None
+    lazy_scene = True
+
+    def check_scene(self):
+        return False
+
+
+class DictObject:
+    '''
+    Objeto equivalente a Object, pero con __dict__
+    '''
+    def __init__(self, client, id):
+        self.client = client
+        self.id = id
+
+
+def objects_info(n):
+    return [(handle, 'object{}'.format(handle), random.choice(OBJECT_TYPES)) for handle in range(0, n)]
+
+
+def measure_memory(build):
+    '''
+    Devuelve la memoria (en KiB) reservada por la función build y el valor devuelto
+    '''
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    value = build()
+    memory = (tracemalloc.get_traced_memory()[0] - start) / 1024
+    tracemalloc.stop()
+    return memory, value
+
+
+def measure_time(method, repeats = 100):
+    '''
+    Devuelve el tiempo medio (en microsegundos) de cada llamada a method
+    '''
+    method()
+    start = perf_counter()
+    for k in range(0, repeats):
+        method()
+    return (perf_counter() - start) * 1000000 / repeats
+
+
+def dict_index(info, bind_object_types):
+    '''
+    Representación anterior del índice de objetos
+    '''
+    object_handlers = dict([(object_name, object_handler) for object_handler, object_name, object_type in info])
+    object_types = dict([(object_name, bind_object_types[object_type]) for object_handler, object_name, object_type in info])
+    return object_handlers, object_types
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    info = objects_info(n)
+    client = OfflineClient()
+
+    objects = ObjectsProxy(client, lazy = True)
+    memory, value = measure_memory(lambda: objects._set_objects_info(info))
+    print('{} objects, columnar index: {:.1f}KiB'.format(n, memory))
+    memory, (object_handlers, object_types) = measure_memory(lambda: dict_index(info, objects.bind_object_types))
+    print('{} objects, dict index: {:.1f}KiB'.format(n, memory))
+
+    memory, value = measure_memory(lambda: [Shape(client, handle) for handle in range(0, n)])
+    print('{} objects with __slots__: {:.1f}KiB'.format(n, memory))
+    memory, value = measure_memory(lambda: [DictObject(client, handle) for handle in range(0, n)])
+    print('{} objects with __dict__: {:.1f}KiB'.format(n, memory))
+
+    names = [object_name for object_handler, object_name, object_type in random.sample(info, 1000)]
+    objects.get_all()
+    print('get() x1000: {:.1f}us'.format(measure_time(lambda: [objects.get(name) for name in names])))
+    print('get_handles_of_type(Joint): {:.1f}us'.format(measure_time(lambda: objects.get_handles_of_type(Joint))))
+    print('get_all_of_type(Joint): {:.1f}us'.format(measure_time(lambda: objects.get_all_of_type(Joint))))
+    print('dict index, handles of type Joint: {:.1f}us'.format(measure_time(
+        lambda: [object_handlers[name] for name in object_types if issubclass(object_types[name], Joint)])))
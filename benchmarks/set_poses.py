@@ -0,0 +1,89 @@
+
+'''
+Compara el tiempo necesario para cambiar la posición y orientación de 10, 100 y 1000 objetos de la escena
+con Scene.set_poses() (una única llamada a un procedimiento remoto) y con una llamada a simxSetObjectPosition y
+otra a simxSetObjectOrientation por cada objeto (bloqueantes, o agrupadas en un paquete con Client.batch())
+
+Los objetos (dummies) se crean al inicio y se eliminan al terminar, por lo que no importa qué otros objetos haya
+en la escena. Antes de ejecutar este script, carga en el programa V-rep una escena con un objeto llamado
+ScriptHandler cuyo script hijo incluya la versión actual de vrep_scripts/remote_methods.lua (por ejemplo
+"template.ttt" en el directorio scenes/, actualizando su script con el de vrep_scripts/ si es necesario, ya que
+Scene.set_poses usa la función lua set_poses)
+Uso: python benchmarks/set_poses.py [número de repeticiones]
+'''
+
+from time import perf_counter
+import sys
+
+import numpy as np
+
+from vrep import Client
+import vrep_binds as binds
+
+
+SIZES = [10, 100, 1000]
+
+
+def create_dummies(client, n):
+    handles = []
+    for i in range(0, n):
+        code, handle = binds.simxCreateDummy(client.get_id(), 0.01, None, binds.simx_opmode_blocking)
+        if code != 0:
+            raise Exception('Failed to create dummy object')
+        handles.append(handle)
+    return np.array(handles, dtype=np.int32)
+
+
+def remove_dummies(client, handles):
+    with client.batch():
+        for handle in handles.tolist():
+            binds.simxRemoveObject(client.get_id(), handle, binds.simx_opmode_oneshot)
+    binds.simxGetPingTime(client.get_id())
+
+
+def set_poses_per_object(client, handles, positions, orientations):
+    for handle, position, orientation in zip(handles.tolist(), positions.tolist(), orientations.tolist()):
+        binds.simxSetObjectPosition(client.get_id(), handle, -1, position, binds.simx_opmode_blocking)
+        binds.simxSetObjectOrientation(client.get_id(), handle, -1, orientation, binds.simx_opmode_blocking)
+
+
+def set_poses_per_object_batched(client, handles, positions, orientations):
+    with client.batch():
+        for handle, position, orientation in zip(handles.tolist(), positions.tolist(), orientations.tolist()):
+            binds.simxSetObjectPosition(client.get_id(), handle, -1, position, binds.simx_opmode_oneshot)
+            binds.simxSetObjectOrientation(client.get_id(), handle, -1, orientation, binds.simx_opmode_oneshot)
+    # Esperamos a que el servidor procese el paquete
+    binds.simxGetPingTime(client.get_id())
+
+
+def set_poses_bulk(client, handles, positions, orientations):
+    client.simulation.scene.set_poses(handles, positions, orientations)
+
+
+def measure(method, client, handles, repeats):
+    '''
+    Devuelve el tiempo medio (en ms) que tarda el método indicado en cambiar la posición de todos los objetos.
+    '''
+    elapsed = 0
+    for k in range(0, repeats):
+        positions = np.random.uniform(-1, 1, (len(handles), 3)).astype(np.float32)
+        positions[:, 2] = 0.5
+        orientations = np.random.uniform(-np.pi, np.pi, (len(handles), 3)).astype(np.float32)
+        start = perf_counter()
+        method(client, handles, positions, orientations)
+        elapsed += perf_counter() - start
+    return elapsed * 1000 / repeats
+
+
+if __name__ == '__main__':
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    with Client('127.0.0.1:19997') as client:
+        for n in SIZES:
+            handles = create_dummies(client, n)
+            try:
+                for method in (set_poses_per_object, set_poses_per_object_batched, set_poses_bulk):
+                    elapsed = measure(method, client, handles, repeats)
+                    print('{} objects, {}: {:.2f}ms'.format(n, method.__name__, elapsed))
+            finally:
+                remove_dummies(client, handles)
@@ -0,0 +1,66 @@
+
+'''
+Comprueba que StreamRegistry solo detiene los streams que no se han leído durante idle_cycles ciclos de control:
+un stream que se lee en todos los ciclos nunca se detiene, y uno que no se lee se detiene justo al terminar
+idle_cycles ciclos sin lecturas (después del ciclo en el que se inició, que cuenta como una lectura).
+
+No necesita que el simulador V-rep esté en ejecución: los streams no envían comandos al servidor.
+Uso: python benchmarks/stream_registry.py [número de ciclos]
+'''
+
+import sys
+
+from vrep import StreamRegistry
+
+
+class OfflineClient:
+    '''
+    Cliente sin conexión con el simulador (no hay velocidades pendientes de enviar)
+    '''
+    def flush_velocities(self):
+        pass
+
+
+class Owner:
+    '''
+    Objeto con un stream (igual que un sensor)
+    '''
+    def __init__(self):
+        self.streamed = True
+        self.initial_value = None
+        self.commands = []
+
+    def command(self, opmode):
+        self.commands.append(opmode)
+
+
+def check(idle_cycles, cycles):
+    '''
+    Devuelve True si el stream leído en todos los ciclos sigue activo y el stream sin lecturas se detiene justo al
+    terminar idle_cycles ciclos sin lecturas.
+    '''
+    registry = StreamRegistry(OfflineClient(), idle_cycles = idle_cycles)
+    read, idle = Owner(), Owner()
+    registry.register(read, 'streamed', 'initial_value', read.command)
+    registry.register(idle, 'streamed', 'initial_value', idle.command)
+
+    stopped_at = None
+    for cycle in range(0, cycles):
+        registry.touch(read, 'streamed', 0.0)
+        registry.tick()
+        if stopped_at is None and not idle.streamed:
+            stopped_at = cycle + 1
+
+    return read.streamed and len(read.commands) == 0 and len(registry) == 1 and stopped_at == idle_cycles + 1
+
+
+if __name__ == '__main__':
+    cycles = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    failed = False
+
+    for idle_cycles in (1, 3, 10):
+        ok = check(idle_cycles, cycles)
+        failed = failed or not ok
+        print('idle_cycles = {}: {}'.format(idle_cycles, 'OK' if ok else 'FAILED'))
+
+    sys.exit(1 if failed else 0)
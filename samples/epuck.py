@@ -29,14 +29,16 @@ if __name__ == '__main__':
                 v3, v4 = epuck.prox_sensor90.value, epuck.prox_sensor270.value
 
                 if v1 <= 0.04 or v2 <= 0.04 or v3 <= 0.04:
-                    epuck.left_motor.speed = -90
-                    epuck.right_motor.speed = 90
+                    left_speed, right_speed = -90, 90
                 elif v4 <= 0.04:
-                    epuck.left_motor.speed = 90
-                    epuck.right_motor.speed = -90
+                    left_speed, right_speed = 90, -90
                 else:
-                    epuck.right_motor.speed = 180
-                    epuck.left_motor.speed = 180
+                    left_speed, right_speed = 180, 180
+
+                # Las velocidades de ambos motores se envían en el mismo paquete
+                with client.batch():
+                    epuck.left_motor.speed = left_speed
+                    epuck.right_motor.speed = right_speed
 
 
         except Exception as e:
@@ -31,18 +31,22 @@ if __name__ == '__main__':
             print('Starting simulation')
 
             while True:
+                speeds = []
                 for epuck in epucks:
                     v1, v2 = epuck.prox_sensor15.value, epuck.prox_sensor345.value
                     v3, v4 = epuck.prox_sensor90.value, epuck.prox_sensor270.value
                     if v1 <= 0.04 or v2 <= 0.04 or v3 <= 0.04:
-                        epuck.left_motor.speed = -90
-                        epuck.right_motor.speed = 90
+                        speeds.append((-90, 90))
                     elif v4 <= 0.04:
-                        epuck.left_motor.speed = 90
-                        epuck.right_motor.speed = -90
+                        speeds.append((90, -90))
                     else:
-                        epuck.right_motor.speed = 180
-                        epuck.left_motor.speed = 180
+                        speeds.append((180, 180))
+
+                # Las velocidades de los motores de todos los robots se envían en el mismo paquete
+                with client.batch():
+                    for epuck, (left_speed, right_speed) in zip(epucks, speeds):
+                        epuck.left_motor.speed = left_speed
+                        epuck.right_motor.speed = right_speed
 
 
         except Exception as e:
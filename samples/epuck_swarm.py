@@ -0,0 +1,46 @@
+
+'''
+Es igual que el ejemplo 2 de como usar robots ePuck en la escena V-rep, solo que ahora todos los robots
+se manejan como un enjambre (ver Swarm): en cada ciclo, las mediciones de todos los sensores se obtienen con una
+única consulta y las velocidades de todos los motores se envían con una única llamada, independientemente
+del número de robots.
+Antes de ejecutar este script, carga en el programa V-rep la escena llamada "epuck_example2.ttt" en el
+directorio scenes/
+'''
+
+import numpy as np
+
+from vrep import Client
+
+if __name__ == '__main__':
+    with Client('127.0.0.1:19997') as client:
+        simulation = client.simulation
+        scene = simulation.scene
+
+        swarm = scene.robots.epuck.swarm()
+        print('Working with {} robots'.format(len(swarm)))
+
+        # Iniciamos la simulación
+        simulation.resume()
+
+        try:
+            print('Starting simulation')
+
+            while True:
+                # Mediciones de los sensores a 15, 345, 90 y 270 grados de todos los robots
+                proximity = swarm.proximity
+                front = np.min(proximity[:, [0, 7, 2]], axis=1) <= 0.04
+                right = proximity[:, 5] <= 0.04
+
+                velocities = np.full((len(swarm), 2), 180, dtype=np.float32)
+                velocities[right] = (90, -90)
+                velocities[front] = (-90, 90)
+                swarm.velocities = velocities
+
+        except Exception as e:
+            print('Something went wrong: {}'.format(e))
+        finally:
+            # Paramos la simulación
+            simulation.stop()
+
+            print('Simulation finish')
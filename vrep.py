@@ -5,9 +5,16 @@ import vrep_binds as binds
 from vrep_errors import *
 from vrep_objects import *
 
-from re import fullmatch
+from re import fullmatch, findall
 from functools import reduce
+from numbers import Integral, Real
+from time import monotonic, sleep
+from os import makedirs, replace, remove, urandom
+from os.path import join, expanduser
+from array import array
 import json
+import struct
+import sys
 
 
 
@@ -29,7 +36,8 @@ class Client:
     Esta clase gestiona la conexión con la API remota de V-Rep
     Crea un cliente que se comunica con la API via sockets.
     '''
-    def __init__(self, address = '127.0.0.1:19997', comm_thread_cycle = 5):
+    def __init__(self, address = '127.0.0.1:19997', comm_thread_cycle = 5, lazy_scene = False, scene_cache = False,
+                 velocity_tolerance = 0.0, velocity_rate_limit = None, stream_idle_cycles = None):
         '''
         Crea un nuevo cliente que se comunica mediante sockets con la API remota de V-Rep
         :param address: Es la dirección IP del servidor que implementa la API V-Rep. Por defecto
@@ -38,6 +46,22 @@ class Client:
         :param comm_thread_cycle: Número de milisegundos que separan dos envíos consecutivos de paquetes por la
         red a la API remota. Reducir esta cantidad mejorará el tiempo de respuesta y la sincronización entre
         cliente y la API remota. Por defecto se establece un valor de 5ms
+
+        :param lazy_scene: Si es True, los objetos de la escena se consultan la primera vez que se accede a ellos
+        en vez de consultar todos los objetos al conectar (ver ObjectsProxy). Por defecto es False
+
+        :param scene_cache: Si es True, la información de los objetos de la escena se guarda en disco (en
+        ~/.cache/pyvrepclient) y se reutiliza en las siguientes conexiones a la misma escena (ver SceneIndexCache).
+        También puede indicarse el directorio donde se guarda. Por defecto es False
+
+        :param velocity_tolerance: Las velocidades de las uniones solo se envían al servidor si difieren de la
+        última enviada en más de esta cantidad. Por defecto es 0 (solo se descartan las velocidades que no cambian)
+
+        :param velocity_rate_limit: Es el número máximo de comandos por segundo para establecer la velocidad de
+        cada unión. Por defecto es None (sin límite). Ver Joint
+
+        :param stream_idle_cycles: Si se indica, los streams que no se leen durante este número de ciclos de
+        control se detienen automáticamente (ver StreamRegistry). Por defecto es None
         '''
 
         # Separamos la ip del puerto
@@ -49,14 +73,40 @@ class Client:
         port = int(fullmatch(':(.+)', port).group(1)) if not port is None else 19997
 
         self.alive = True
+        self.batch_depth = 0
+        self.lazy_scene = lazy_scene
+        self.address = '{}:{}'.format(ip, port)
         self.id = binds.simxStart(ip, port, True, True, 5000, comm_thread_cycle)
 
         if self.id == -1:
             raise ConnectionError(ip, port)
 
+        if scene_cache is False or scene_cache is None:
+            self.scene_cache = None
+        else:
+            self.scene_cache = SceneIndexCache(self, None if scene_cache is True else scene_cache)
+
+        self.scene_id = None
+        self.server_state = None
+
+        self.velocity_tolerance = velocity_tolerance
+        self.velocity_rate_limit = velocity_rate_limit
+        # Se incrementa cuando las últimas velocidades enviadas a las uniones dejan de ser válidas
+        self.velocity_epoch = 0
+        # Última velocidad enviada a cada unión (identificador -> (velocidad, instante, velocity_epoch)) y
+        # uniones con una velocidad pendiente de enviar por el límite velocity_rate_limit (identificador -> Joint)
+        self.joint_velocities = {}
+        self.pending_velocities = {}
+        self.velocity_commands_sent = 0
+        self.velocity_commands_suppressed = 0
+
+        self.streams = StreamRegistry(self, idle_cycles = stream_idle_cycles)
+
         self.sync_remote_methods = RemoteMethodsProxy(self, async = False)
         self.async_remote_methods = RemoteMethodsProxy(self, async = True)
+        self.future_remote_methods = FutureRemoteMethodsProxy(self)
         self.simulation = Simulation(self)
+        self.check_scene()
 
     @alive
     def close(self):
@@ -83,6 +133,105 @@ class Client:
         '''
         return self.alive
 
+    def flush_velocities(self):
+        '''
+        Envía las velocidades de las uniones que quedaron pendientes por el límite velocity_rate_limit, si ya ha
+        pasado el intervalo mínimo entre comandos. Se invoca en cada ciclo de control (ver StreamRegistry.tick:
+        Simulation.step() lo invoca automáticamente; en modo asíncrono debe invocarse client.streams.tick() en cada
+        iteración del bucle de control)
+        '''
+        if len(self.pending_velocities) == 0:
+            return
+        now = monotonic()
+        for handle, joint in list(self.pending_velocities.items()):
+            last = self.joint_velocities.get(handle)
+            if last is None or last[2] != self.velocity_epoch:
+                # Se ha parado la simulación o ha cambiado la escena
+                del self.pending_velocities[handle]
+                joint.pending_velocity = None
+            elif self.velocity_rate_limit is None or now - last[1] >= 1 / self.velocity_rate_limit:
+                joint.flush_velocity()
+
+
+    class Batch:
+        '''
+        Gestor de contexto devuelto por Client.batch(). Los bloques with pueden anidarse; la comunicación
+        se reanuda al salir del bloque más externo.
+        '''
+        def __init__(self, client):
+            self.client = client
+
+        def __enter__(self):
+            if self.client.batch_depth == 0:
+                code = binds.simxPauseCommunication(self.client.get_id(), True)
+                if code != 0:
+                    raise Exception('Failed to pause communication with V-rep remote API server')
+            self.client.batch_depth += 1
+            return self.client
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.client.batch_depth -= 1
+            if self.client.batch_depth == 0:
+                code = binds.simxPauseCommunication(self.client.get_id(), False)
+                if code != 0:
+                    raise Exception('Failed to resume communication with V-rep remote API server')
+
+
+    @alive
+    def batch(self):
+        '''
+        Devuelve un gestor de contexto que agrupa todos los comandos enviados dentro del bloque with en
+        un único paquete. El servidor aplica todos los comandos del paquete en el mismo paso de simulación.
+        e.g:
+        with client.batch():
+            epuck.left_motor.speed = 90
+            epuck.right_motor.speed = -90
+        '''
+        return self.Batch(self)
+
+
+    @alive
+    def remote_batch(self):
+        '''
+        Devuelve un lote de llamadas a procedimientos remotos que se envían al simulador en una única petición
+        al salir del bloque with. Es igual que self.sync_remote_methods.batch()
+        e.g:
+        with client.remote_batch() as batch:
+            for light in scene.lights:
+                batch.setLightState(light.get_id(), True)
+        '''
+        return self.sync_remote_methods.batch()
+
+
+    @alive
+    def check_scene(self):
+        '''
+        Comprueba si la escena del simulador ha cambiado desde la última comprobación. Se usan el identificador
+        de la escena y el estado del servidor que el simulador indica en la cabecera de cada mensaje (se consulta
+        la cabecera del último mensaje recibido, sin enviar ninguna petición al servidor).
+        La escena ha cambiado si el identificador de la escena es distinto (se ha cargado o cambiado de escena) o si
+        el simulador ha salido del modo de edición. En ese caso se invalida la información de los objetos de la
+        escena (ver Scene.invalidate())
+        :return: Devuelve True si la escena ha cambiado, False en caso contrario.
+        '''
+        code, scene_id = binds.simxGetInMessageInfo(self.id, binds.simx_headeroffset_scene_id)
+        if code == -1:
+            return False
+        code, server_state = binds.simxGetInMessageInfo(self.id, binds.simx_headeroffset_server_state)
+
+        previous_scene_id, previous_server_state = self.scene_id, self.server_state
+        self.scene_id, self.server_state = scene_id, server_state
+        if previous_scene_id is None:
+            return False
+
+        # Los bits 3-5 del estado del servidor indican el modo de edición (0 si no está en modo de edición)
+        edit_mode_exited = (previous_server_state >> 3) & 7 != 0 and (server_state >> 3) & 7 == 0
+        if scene_id == previous_scene_id and not edit_mode_exited:
+            return False
+
+        self.simulation.scene.invalidate()
+        return True
+
 
     @alive
     def get_id(self):
@@ -105,6 +254,182 @@ class Client:
 
 
 
+class StreamRegistry:
+    '''
+    Registro de los streams de datos iniciados por el cliente (ver DataStream). Permite consultar los streams
+    activos y una estimación de los bytes por segundo que envía el servidor por cada uno, y detenerlos (con los
+    modos de operación discontinue y remove, que liberan también las respuestas del buffer del cliente).
+
+    Cada invocación de tick() es un ciclo de control (Simulation.step() lo invoca automáticamente; en modo
+    asíncrono debe invocarse en cada iteración del bucle de control). Si se indica idle_cycles, los streams que
+    no se leen durante ese número de ciclos se detienen. Un stream detenido se vuelve a iniciar si se vuelve a leer.
+    '''
+    class Stream:
+        def __init__(self, owner, streamed_attr, initial_value_attr, command, cycle):
+            self.owner = owner
+            self.streamed_attr = streamed_attr
+            self.initial_value_attr = initial_value_attr
+            self.command = command
+            self.reads = 0
+            self.last_read_cycle = cycle
+            self.bytes_per_sample = 0
+            # Marca de tiempo de la última medición recibida y de la última devuelta
+            self.sample_time = None
+            self.consumed_sample_time = None
+
+        def get_name(self):
+            name = self.owner.__class__.__name__
+            if isinstance(self.owner, (Object, Trajectory)):
+                name = '{}({})'.format(name, self.owner.id)
+            return name if self.streamed_attr == 'streamed' else '{}.{}'.format(name, self.streamed_attr)
+
+
+    def __init__(self, client, idle_cycles = None):
+        self.client = client
+        self.idle_cycles = idle_cycles
+        self.streams = {}
+        self.cycle = 0
+        self.time_step = None
+
+    @staticmethod
+    def _get_size(value):
+        '''
+        Devuelve el tamaño aproximado (en bytes) de una medición
+        '''
+        if hasattr(value, 'nbytes'):
+            return value.nbytes
+        if isinstance(value, (tuple, list)):
+            return sum(StreamRegistry._get_size(item) for item in value)
+        return 4
+
+    def register(self, owner, streamed_attr, initial_value_attr, command):
+        '''
+        Registra un stream iniciado. Lo invoca DataStream al iniciar cada stream.
+        '''
+        self.streams[(owner, streamed_attr)] = self.Stream(owner, streamed_attr, initial_value_attr, command, self.cycle)
+
+    def touch(self, owner, streamed_attr, value, sample_time = None):
+        '''
+        Indica que se ha leído una medición de un stream. Lo invoca DataStream en cada lectura.
+        :param sample_time: Es la marca de tiempo de la medición, o None si no se ha recibido una nueva medición.
+        :return: Devuelve True si la medición no se había devuelto en una lectura anterior (o si el stream no está
+        registrado), False en caso contrario.
+        '''
+        stream = self.streams.get((owner, streamed_attr))
+        if stream is None:
+            return True
+
+        stream.reads += 1
+        stream.last_read_cycle = self.cycle
+        stream.bytes_per_sample = self._get_size(value)
+        if not sample_time is None:
+            stream.sample_time = sample_time
+        is_new = stream.sample_time != stream.consumed_sample_time
+        stream.consumed_sample_time = stream.sample_time
+        return is_new
+
+    def get_sample_time(self, owner, streamed_attr = 'streamed'):
+        '''
+        Devuelve la marca de tiempo de la última medición de un stream, o None si el stream no está registrado.
+        '''
+        stream = self.streams.get((owner, streamed_attr))
+        return stream.sample_time if not stream is None else None
+
+    def tick(self):
+        '''
+        Indica que ha terminado un ciclo de control. Envía las velocidades de las uniones que quedaron pendientes por el
+        límite de comandos por segundo (ver Client.flush_velocities) y, si se ha indicado idle_cycles, detiene los
+        streams que no se han leído durante ese número de ciclos.
+        '''
+        self.client.flush_velocities()
+        self.cycle += 1
+        if not self.idle_cycles is None:
+            self.stop_idle(self.idle_cycles)
+
+    def _stop(self, stream):
+        del self.streams[(stream.owner, stream.streamed_attr)]
+        stream.command(binds.simx_opmode_discontinue)
+        stream.command(binds.simx_opmode_remove)
+        setattr(stream.owner, stream.streamed_attr, False)
+        setattr(stream.owner, stream.initial_value_attr, None)
+
+    def stop(self, owner = None, streamed_attr = None):
+        '''
+        Detiene streams. El servidor deja de enviar sus datos y se liberan las respuestas del buffer del cliente.
+        :param owner: Si se indica, solo se detienen los streams de este objeto (p.ej un sensor)
+        :param streamed_attr: Si se indica, solo se detiene el stream de owner con este atributo (p.ej
+        'depth_streamed' en los sensores de visión)
+        :return: Devuelve el número de streams detenidos.
+        '''
+        streams = [stream for stream in self.streams.values() if (owner is None or stream.owner is owner) and
+                   (streamed_attr is None or stream.streamed_attr == streamed_attr)]
+        for stream in streams:
+            self._stop(stream)
+        return len(streams)
+
+    def stop_idle(self, cycles):
+        '''
+        Detiene los streams que no se han leído durante el número de ciclos indicado.
+        :return: Devuelve el número de streams detenidos.
+        '''
+        # Un stream leído en el ciclo last_read_cycle no se ha leído en los ciclos terminados siguientes:
+        # self.cycle - last_read_cycle - 1
+        streams = [stream for stream in self.streams.values() if self.cycle - stream.last_read_cycle > cycles]
+        for stream in streams:
+            self._stop(stream)
+        return len(streams)
+
+    def rearm(self):
+        '''
+        Marca todos los streams como no iniciados para que se vuelvan a iniciar en su siguiente lectura (con una
+        petición bloqueante). Se invoca al reiniciar la simulación.
+        '''
+        for stream in self.streams.values():
+            setattr(stream.owner, stream.streamed_attr, False)
+            setattr(stream.owner, stream.initial_value_attr, None)
+
+    def get_time_step(self):
+        '''
+        Devuelve el paso de simulación (en segundos). Se consulta solo una vez.
+        '''
+        if self.time_step is None:
+            code, time_step = binds.simxGetFloatingParameter(self.client.get_id(), binds.sim_floatparam_simulation_time_step,
+                                                             binds.simx_opmode_blocking)
+            if code != 0:
+                raise Exception('Failed to get V-rep simulation time step')
+            self.time_step = time_step
+        return self.time_step
+
+    def list(self):
+        '''
+        Devuelve información de los streams activos: una lista de diccionarios con el nombre del stream, el número de
+        lecturas, los ciclos desde la última lectura, el tamaño de la última medición y una estimación de los bytes por
+        segundo que envía el servidor (el servidor envía una respuesta en cada paso de simulación)
+        '''
+        time_step = self.get_time_step() if len(self.streams) > 0 else None
+        return [{
+            'name' : stream.get_name(),
+            'reads' : stream.reads,
+            'idle_cycles' : self.cycle - stream.last_read_cycle,
+            'bytes_per_sample' : stream.bytes_per_sample,
+            'byte_rate' : stream.bytes_per_sample / time_step,
+            'sample_time' : stream.sample_time
+        } for stream in self.streams.values()]
+
+    def get_byte_rate(self):
+        '''
+        Devuelve una estimación de los bytes por segundo que envía el servidor por todos los streams activos.
+        '''
+        return sum(stream['byte_rate'] for stream in self.list())
+
+    def __len__(self):
+        return len(self.streams)
+
+    def __iter__(self):
+        return iter(self.list())
+
+
+
 class Simulation:
     def __init__(self, client):
         '''
@@ -114,6 +439,7 @@ class Simulation:
         '''
         self.client = client
         self.running = False
+        self.synchronous_mode = False
         self.init()
         self.scene = Scene(self.client)
 
@@ -142,6 +468,8 @@ class Simulation:
                 raise Exception('Failed to resume V-rep simulation')
 
             self.running = True
+            # Los streams se vuelven a iniciar en la siguiente lectura
+            self.client.streams.rearm()
 
     def pause(self):
         '''
@@ -166,6 +494,7 @@ class Simulation:
                 raise Exception('Failed to stop V-rep simulation')
 
             self.running = False
+            self.client.velocity_epoch += 1
 
     def is_running(self):
         '''
@@ -174,6 +503,110 @@ class Simulation:
         '''
         return self.running
 
+
+    class SynchronousMode:
+        '''
+        Gestor de contexto devuelto por Simulation.synchronous(). Activa el modo síncrono al entrar y al salir
+        lo deja como estaba antes del bloque with.
+        '''
+        def __init__(self, simulation):
+            self.simulation = simulation
+            self.was_synchronous = None
+
+        def __enter__(self):
+            self.was_synchronous = self.simulation.is_synchronous()
+            if not self.was_synchronous:
+                self.simulation.set_synchronous(True)
+            return self.simulation
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if not self.was_synchronous:
+                self.simulation.set_synchronous(False)
+
+
+    def set_synchronous(self, enabled):
+        '''
+        Activa o desactiva el modo síncrono. En modo síncrono, el simulador no avanza hasta que el cliente
+        lo indica con el método step()
+        :param enabled: True para activar el modo síncrono, False para desactivarlo
+        '''
+        code = binds.simxSynchronous(self.client.get_id(), enabled)
+        if code != 0:
+            raise Exception('Failed to {} V-rep synchronous mode'.format('enable' if enabled else 'disable'))
+        self.synchronous_mode = enabled
+
+    def is_synchronous(self):
+        '''
+        Comprueba si el modo síncrono está activado.
+        '''
+        return self.synchronous_mode
+
+    def synchronous(self):
+        '''
+        Devuelve un gestor de contexto que activa el modo síncrono mientras dure el bloque with.
+        e.g:
+        with simulation.synchronous():
+            simulation.step()
+        '''
+        return self.SynchronousMode(self)
+
+    def barrier(self):
+        '''
+        Espera a que el servidor haya procesado todos los comandos enviados hasta ahora. En modo síncrono,
+        después de invocar este método, el último paso de simulación indicado con step() ha terminado y
+        las respuestas de los streams de ese paso ya están en el buffer del cliente.
+        '''
+        code, ping_time = binds.simxGetPingTime(self.client.get_id())
+        if code != 0:
+            raise Exception('Failed to synchronize with V-rep remote API server')
+        self.client.check_scene()
+
+    def step(self, n = 1, wait = True):
+        '''
+        Avanza la simulación n pasos. El modo síncrono debe estar activado y la simulación en ejecución.
+        :param n: Es el número de pasos de simulación. Por defecto 1
+        :param wait: Si es True (por defecto), espera a que termine el último paso (ver barrier()). Si es False,
+        el método vuelve nada más enviar las señales al servidor.
+        '''
+        if not self.synchronous_mode:
+            raise Exception('Failed to step V-rep simulation: Synchronous mode is not enabled')
+        if not self.running:
+            raise Exception('Failed to step V-rep simulation: V-rep simulation is not running')
+
+        for i in range(0, n):
+            code = binds.simxSynchronousTrigger(self.client.get_id())
+            if code != 0:
+                raise Exception('Failed to step V-rep simulation')
+        self.client.streams.tick()
+        if wait:
+            self.barrier()
+
+    def steps(self, n = None, barrier_every = None):
+        '''
+        Generador para ejecutar un bucle de control en modo síncrono con los pasos de simulación solapados:
+        la señal del paso k+1 se envía antes de devolver el paso k, de forma que el simulador calcula el paso k+1
+        mientras el cliente procesa las mediciones del paso k. Los comandos enviados durante la iteración k se
+        aplican en el paso k+2. Solo se espera a que el servidor termine (ver barrier()) al inicio y cada
+        barrier_every pasos.
+        e.g:
+        with simulation.synchronous():
+            for k in simulation.steps(1000):
+                value = sensor.value
+                ...
+        :param n: Es el número de pasos. Si es None, el generador no termina.
+        :param barrier_every: Si se indica, se espera a que el servidor termine cada barrier_every pasos.
+        :return: Devuelve el índice de cada paso.
+        '''
+        self.step(wait = True)
+        k = 0
+        while n is None or k < n:
+            if n is None or k + 1 < n:
+                self.step(wait = False)
+            yield k
+            k += 1
+            if not barrier_every is None and k % barrier_every == 0:
+                self.barrier()
+
     def __enter__(self):
         self.resume()
         return self
@@ -186,6 +619,10 @@ class RemoteMethodsProxy:
     '''
     Clase auxiliar usada por Client para hacer llamadas a procedimientos remotos en un script lua en el
     simulador V-rep
+
+    Si todos los argumentos son números, booleanos, cadenas de caracteres, None o listas / arrays numpy de una
+    dimensión de números, se codifican en binario (ver encode_args) y la llamada la atiende la función lua
+    binary_proxy. En caso contrario, los argumentos se codifican en JSON y la llamada la atiende function_proxy.
     '''
     class RemoteMethod:
         def __init__(self, client, name, async):
@@ -194,21 +631,31 @@ class RemoteMethodsProxy:
             self.async = async
 
         def __call__(self, *args):
+            encoded_args = RemoteMethodsProxy.encode_args(args)
+            if not encoded_args is None:
+                signature, ints, floats, strings = encoded_args
+                proxy, strings = 'binary_proxy', [self.name, signature] + strings
+            else:
+                ints, floats = [], []
+                proxy, strings = 'function_proxy', [self.name, json.dumps(args)]
+
             result = binds.simxCallScriptFunction(self.client.get_id(), 'ScriptHandler',
                                                   binds.sim_scripttype_childscript,
-                                                  'function_proxy',
-                                                  [], [], [self.name, json.dumps(args)], bytearray(),
-                                                  binds.simx_opmode_blocking if not self.async else binds.simx_opmode_oneshot)
+                                                  proxy,
+                                                  ints, floats, strings, bytearray(),
+                                                  binds.simx_opmode_blocking if not self.async else binds.simx_opmode_oneshot,
+                                                  returnArrays = 'numpy' in sys.modules)
             if not self.async:
                 code, ints, floats, strings, buffer = result
                 try:
                     if code != 0:
                         raise Exception()
                     try:
-                        result = tuple(json.loads(strings[0]))
-                        if len(result) == 0:
-                            return None
-                        return result[0] if len(result) == 1 else result
+                        if proxy == 'binary_proxy':
+                            result, offsets = RemoteMethodsProxy.decode_results(ints, floats, strings)
+                        else:
+                            result = tuple(json.loads(strings[0]))
+                        return RemoteMethodsProxy.unwrap_results(result)
                     except:
                         raise Exception()
                 except:
@@ -226,11 +673,415 @@ class RemoteMethodsProxy:
         return self.__getitem__(method_name)
 
 
+    @staticmethod
+    def encode_args(args):
+        '''
+        Codifica los argumentos de una llamada a un procedimiento remoto en binario. Cada argumento se indica
+        en la firma con un código: 'n' (None), 'b' (booleano), 'i' (entero), 'f' (número real), 's' (cadena de
+        caracteres), 'I<n>' (lista de n enteros) o 'F<n>' (lista de n números reales). Los enteros y booleanos
+        se envían en inInts, los números reales en inFloats (con precisión simple) y las cadenas en inStrings.
+        :return: Devuelve una tupla (firma, enteros, reales, cadenas), o None si alguno de los argumentos no
+        puede codificarse en binario (por ejemplo, estructuras anidadas)
+        Si ninguno de los argumentos es un array numpy, no se importa numpy.
+        '''
+        np = sys.modules.get('numpy')
+        bool_types = (bool, np.bool_) if not np is None else bool
+
+        signature, ints, floats, strings = '', [], [], []
+        for arg in args:
+            if arg is None:
+                signature += 'n'
+            elif isinstance(arg, bool_types):
+                signature += 'b'
+                ints.append(int(arg))
+            elif isinstance(arg, Integral):
+                if not -2**31 <= arg < 2**31:
+                    return None
+                signature += 'i'
+                ints.append(int(arg))
+            elif isinstance(arg, Real):
+                signature += 'f'
+                floats.append(float(arg))
+            elif isinstance(arg, str):
+                signature += 's'
+                strings.append(arg)
+            elif isinstance(arg, (list, tuple)):
+                # Igual que con los arrays numpy: listas de enteros (no todos booleanos) o de números reales
+                if not all(isinstance(value, Real) for value in arg) or (len(arg) > 0 and all(isinstance(value, bool_types) for value in arg)):
+                    return None
+                if len(arg) > 0 and all(isinstance(value, Integral) for value in arg):
+                    if min(arg) < -2**31 or max(arg) >= 2**31:
+                        return None
+                    signature += 'I{}'.format(len(arg))
+                    ints.extend(int(value) for value in arg)
+                else:
+                    signature += 'F{}'.format(len(arg))
+                    floats.extend(float(value) for value in arg)
+            elif not np is None and isinstance(arg, np.ndarray):
+                if arg.ndim != 1 or not arg.dtype.kind in 'iuf':
+                    return None
+                if arg.dtype.kind in 'iu':
+                    if len(arg) > 0 and (arg.min() < -2**31 or arg.max() >= 2**31):
+                        return None
+                    signature += 'I{}'.format(len(arg))
+                    ints.extend(arg.tolist())
+                else:
+                    signature += 'F{}'.format(len(arg))
+                    floats.extend(arg.tolist())
+            else:
+                return None
+        return signature, ints, floats, strings
+
+    @staticmethod
+    def encode_call(method_name, args):
+        '''
+        Codifica una llamada a un procedimiento remoto para las funciones lua batch_proxy y async_proxy.
+        Los argumentos se codifican en binario (ver encode_args) o en JSON (con la firma 'j') si no es posible.
+        :return: Devuelve una tupla (enteros, reales, cadenas). Las cadenas empiezan por el nombre del
+        procedimiento y la firma de los argumentos.
+        '''
+        encoded_args = RemoteMethodsProxy.encode_args(args)
+        if encoded_args is None:
+            return [], [], [method_name, 'j', json.dumps(args)]
+        signature, ints, floats, strings = encoded_args
+        return ints, floats, [method_name, signature] + strings
+
+    @staticmethod
+    def decode_reply(method_name, ints, floats, strings, offsets = (0, 0, 0)):
+        '''
+        Decodifica la respuesta de una llamada atendida por las funciones lua batch_proxy o async_proxy: 'ok'
+        seguido de los valores devueltos (ver decode_results) o 'e' seguido del mensaje de error.
+        :return: Devuelve una tupla (resultado, excepción, posiciones). Si la llamada ha fallado, el resultado es
+        None y la excepción una instancia de RemoteMethodError. En caso contrario la excepción es None.
+        '''
+        i, f, s = offsets
+        status = strings[s]
+        if status == 'e':
+            return None, RemoteMethodError(method_name, strings[s + 1]), (i, f, s + 2)
+        results, offsets = RemoteMethodsProxy.decode_results(ints, floats, strings, (i, f, s + 1))
+        return RemoteMethodsProxy.unwrap_results(results), None, offsets
+
+    @staticmethod
+    def decode_results(ints, floats, strings, offsets = (0, 0, 0)):
+        '''
+        Decodifica los valores devueltos por la función lua binary_proxy. El primer elemento de strings es la
+        firma de los valores (con los mismos códigos que encode_args), o 'j' si los valores se devolvieron en JSON
+        porque no podían codificarse en binario. Las listas de números se devuelven como arrays numpy.
+        :param offsets: Es una tupla con las posiciones de ints, floats y strings donde empiezan los valores.
+        :return: Devuelve una tupla con los valores devueltos por el procedimiento remoto y otra tupla con las
+        posiciones de ints, floats y strings siguientes a los valores decodificados.
+        '''
+        i, f, s = offsets
+        signature = strings[s]
+        s += 1
+        if signature == 'j':
+            return tuple(json.loads(strings[s])), (i, f, s + 1)
+
+        results = []
+        for code, length in findall('([a-zA-Z])(\\d*)', signature):
+            if code == 'n':
+                results.append(None)
+            elif code == 'b':
+                results.append(bool(ints[i]))
+                i += 1
+            elif code == 'i':
+                results.append(int(ints[i]))
+                i += 1
+            elif code == 'f':
+                results.append(float(floats[f]))
+                f += 1
+            elif code == 's':
+                results.append(strings[s])
+                s += 1
+            elif code == 'I':
+                import numpy as np
+                results.append(np.asarray(ints[i:i+int(length)], dtype=np.int32))
+                i += int(length)
+            elif code == 'F':
+                import numpy as np
+                results.append(np.asarray(floats[f:f+int(length)], dtype=np.float32))
+                f += int(length)
+        return tuple(results), (i, f, s)
+
+    @staticmethod
+    def unwrap_results(results):
+        '''
+        Devuelve None si el procedimiento remoto no devolvió ningún valor, el valor si solo devolvió uno, o la tupla
+        de valores en otro caso.
+        '''
+        if len(results) == 0:
+            return None
+        return results[0] if len(results) == 1 else results
+
+
+    class Batch:
+        '''
+        Agrupa varias llamadas a procedimientos remotos para enviarlas al simulador en una única llamada a
+        simxCallScriptFunction (las atiende la función lua batch_proxy). Se obtiene con RemoteMethodsProxy.batch()
+        o Client.remote_batch(). Cada llamada devuelve un futuro (concurrent.futures.Future) que se resuelve
+        al enviar el lote.
+        e.g:
+        with client.remote_batch() as batch:
+            future = batch.get_objects_info()
+            batch.setLightState(light.get_id(), True)
+        print(future.result())
+        '''
+        def __init__(self, client):
+            self.client = client
+            self.calls = []
+
+        def call(self, method_name, *args):
+            '''
+            Añade una llamada al lote.
+            :return: Devuelve un futuro con el resultado de la llamada. Si el procedimiento remoto falla, el
+            futuro contendrá una excepción RemoteMethodError.
+            '''
+            from concurrent.futures import Future
+
+            future = Future()
+            self.calls.append((method_name, args, future))
+            return future
+
+        def send(self):
+            '''
+            Envía todas las llamadas del lote al simulador y espera a sus resultados.
+            '''
+            calls, self.calls = self.calls, []
+            if len(calls) == 0:
+                return
+
+            ints, floats, strings = [], [], []
+            for method_name, args, future in calls:
+                call_ints, call_floats, call_strings = RemoteMethodsProxy.encode_call(method_name, args)
+                ints.extend(call_ints)
+                floats.extend(call_floats)
+                strings.extend(call_strings)
+
+            code, ints, floats, strings, buffer = binds.simxCallScriptFunction(self.client.get_id(), 'ScriptHandler',
+                                                  binds.sim_scripttype_childscript,
+                                                  'batch_proxy',
+                                                  ints, floats, strings, bytearray(),
+                                                  binds.simx_opmode_blocking, returnArrays = 'numpy' in sys.modules)
+            if code != 0:
+                for method_name, args, future in calls:
+                    if future.set_running_or_notify_cancel():
+                        future.set_exception(RemoteMethodError(method_name))
+                return
+
+            offsets = (0, 0, 0)
+            for method_name, args, future in calls:
+                try:
+                    result, exc, offsets = RemoteMethodsProxy.decode_reply(method_name, ints, floats, strings, offsets)
+                except (ValueError, IndexError, KeyError, TypeError):
+                    result, exc = None, RemoteMethodError(method_name)
+                # Los futuros cancelados por el usuario descartan su resultado
+                if not future.set_running_or_notify_cancel():
+                    continue
+                if exc is None:
+                    future.set_result(result)
+                else:
+                    future.set_exception(exc)
+
+        def cancel(self):
+            '''
+            Descarta todas las llamadas del lote sin enviarlas. Sus futuros quedan cancelados.
+            '''
+            calls, self.calls = self.calls, []
+            for method_name, args, future in calls:
+                future.cancel()
+
+        def __getitem__(self, method_name):
+            return lambda *args: self.call(method_name, *args)
+
+        def __getattr__(self, method_name):
+            return self.__getitem__(method_name)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            # Si se ha generado una excepción en el bloque with, las llamadas no se envían y se cancelan sus futuros
+            # (para que no se quede esperando a su resultado)
+            if exc_type is None:
+                self.send()
+            else:
+                self.cancel()
+
+
+    def batch(self):
+        '''
+        Devuelve un lote de llamadas a procedimientos remotos (ver RemoteMethodsProxy.Batch) que se envían juntas
+        en una única llamada al salir del bloque with.
+        '''
+        return self.Batch(self.client)
+
+
+
+class FutureRemoteMethodsProxy:
+    '''
+    Clase auxiliar usada por Client para hacer llamadas asíncronas a procedimientos remotos en un script lua en el
+    simulador V-rep que devuelven su resultado. Cada llamada se envía sin esperar la respuesta
+    (simx_opmode_oneshot) y devuelve un futuro. La función lua async_proxy escribe la respuesta en una señal
+    de cadena propia de la llamada, que el cliente recibe con un stream y consulta en su buffer con poll().
+    e.g:
+    future = client.future_remote_methods.get_objects_info()
+    ...
+    client.future_remote_methods.poll()
+    if future.done():
+        print(future.result())
+    '''
+    class RemoteMethod:
+        def __init__(self, proxy, name):
+            self.proxy = proxy
+            self.name = name
+
+        def __call__(self, *args):
+            return self.proxy.call(self.name, *args)
+
+
+    # Clase de los futuros devueltos por las llamadas (ver _get_future_class)
+    RemoteFuture = None
+
+    @classmethod
+    def _get_future_class(cls):
+        '''
+        Devuelve la clase de los futuros devueltos por las llamadas. Se define la primera vez que se invoca este
+        método, para que concurrent.futures solo se importe si se usan llamadas con futuros.
+        '''
+        if cls.RemoteFuture is None:
+            from concurrent.futures import Future, TimeoutError
+
+            class RemoteFuture(Future):
+                '''
+                Futuro devuelto por las llamadas de FutureRemoteMethodsProxy. Los métodos result() y exception()
+                consultan las respuestas recibidas (ver FutureRemoteMethodsProxy.poll()) mientras esperan.
+                '''
+                def __init__(self, proxy):
+                    super().__init__()
+                    self.proxy = proxy
+
+                def wait(self, timeout = None):
+                    '''
+                    Espera hasta que se reciba la respuesta o hasta que pasen timeout segundos.
+                    '''
+                    start = monotonic()
+                    while not self.done():
+                        self.proxy.poll()
+                        if self.done():
+                            break
+                        if not timeout is None and monotonic() - start >= timeout:
+                            raise TimeoutError()
+                        sleep(self.proxy.poll_interval)
+
+                def result(self, timeout = None):
+                    self.wait(timeout)
+                    return super().result(0)
+
+                def exception(self, timeout = None):
+                    self.wait(timeout)
+                    return super().exception(0)
+
+            cls.RemoteFuture = RemoteFuture
+        return cls.RemoteFuture
+
+
+    def __init__(self, client, poll_interval = 0.001):
+        '''
+        Inicializa la instancia.
+        :param client: Es una instancia de la clase Client.
+        :param poll_interval: Número de segundos entre dos consultas consecutivas de las respuestas al esperar
+        el resultado de una llamada con result() o exception()
+        '''
+        self.client = client
+        self.poll_interval = poll_interval
+        # Los nombres de las señales de respuesta incluyen un identificador único de esta instancia, para que
+        # no coincidan con los de otros clientes (o de conexiones anteriores)
+        self.token = urandom(16).hex()
+        self.next_call_id = 0
+        self.pending = {}
+
+    def call(self, method_name, *args):
+        '''
+        Envía una llamada a un procedimiento remoto sin esperar la respuesta.
+        :return: Devuelve un futuro con el resultado de la llamada. Si el procedimiento remoto falla, el futuro
+        contendrá una excepción RemoteMethodError.
+        '''
+        signal_name = 'pyvrepclient_reply_{}_{}'.format(self.token, self.next_call_id)
+        self.next_call_id += 1
+
+        ints, floats, strings = RemoteMethodsProxy.encode_call(method_name, args)
+        future = self._get_future_class()(self)
+        # Borramos cualquier respuesta anterior en la señal antes de enviar la llamada
+        binds.simxClearStringSignal(self.client.get_id(), signal_name, binds.simx_opmode_oneshot)
+        code, ints, floats, strings, buffer = binds.simxCallScriptFunction(self.client.get_id(), 'ScriptHandler',
+                                              binds.sim_scripttype_childscript,
+                                              'async_proxy',
+                                              ints, floats, [signal_name] + strings, bytearray(),
+                                              binds.simx_opmode_oneshot)
+        code, value = binds.simxGetStringSignal(self.client.get_id(), signal_name, binds.simx_opmode_streaming)
+        if not code in [0, 1]:
+            future.set_exception(RemoteMethodError(method_name))
+            return future
+
+        self.pending[signal_name] = (method_name, future)
+        return future
+
+    def poll(self):
+        '''
+        Consulta en el buffer del cliente las respuestas recibidas y resuelve los futuros de las llamadas
+        correspondientes. No envía ninguna petición bloqueante al servidor.
+        :return: Devuelve el número de llamadas pendientes de respuesta.
+        '''
+        client_id = self.client.get_id()
+        for signal_name, (method_name, future) in list(self.pending.items()):
+            code, reply = binds.simxGetStringSignal(client_id, signal_name, binds.simx_opmode_buffer)
+            if code != 0:
+                continue
+
+            del self.pending[signal_name]
+            binds.simxGetStringSignal(client_id, signal_name, binds.simx_opmode_discontinue)
+            binds.simxGetStringSignal(client_id, signal_name, binds.simx_opmode_remove)
+            binds.simxClearStringSignal(client_id, signal_name, binds.simx_opmode_oneshot)
+
+            # Si el usuario ha cancelado el futuro, la respuesta se descarta
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                reply = bytes(reply)
+                ints_count, floats_count, strings_count = struct.unpack_from('<3i', reply)
+                offset = 12
+                ints = struct.unpack_from('<{}i'.format(ints_count), reply, offset)
+                offset += 4 * ints_count
+                floats = struct.unpack_from('<{}f'.format(floats_count), reply, offset)
+                offset += 4 * floats_count
+                strings = [string.decode('utf-8') for string in reply[offset:].split(b'\0')[:strings_count]]
+
+                result, exc, offsets = RemoteMethodsProxy.decode_reply(method_name, ints, floats, strings)
+            except (ValueError, IndexError, KeyError, TypeError, struct.error):
+                # Respuesta mal formada
+                result, exc = None, RemoteMethodError(method_name)
+
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
 
-class Scene:
+        return len(self.pending)
+
+    def __getitem__(self, method_name):
+        return self.RemoteMethod(self, method_name)
+
+    def __getattr__(self, method_name):
+        return self.__getitem__(method_name)
+
+
+
+class Scene(DataStream):
     '''
     Esta clase permite obtener información de los objetos de la escena del simulador V-rep.
     '''
+    stream_attrs = (('poses_streamed', 'initial_poses'),)
+
     def __init__(self, client):
         '''
         Inicializa la instancia.
@@ -238,8 +1089,10 @@ class Scene:
         API remoto de V-rep donde se llevará a cabo esta simulación
         '''
         self.client = client
+        self.poses_streamed = False
+        self.initial_poses = None
 
-        self.objects = ObjectsProxy(self.client)
+        self.objects = ObjectsProxy(self.client, lazy = self.client.lazy_scene)
         self.joints = self.objects.joints
         self.proximity_sensors = self.objects.proximity_sensors
         self.vision_sensors = self.objects.vision_sensors
@@ -247,6 +1100,113 @@ class Scene:
         self.lights = self.objects.lights
         self.robots = ObjectsCollectionsProxy(self, robots.classes)
 
+    def invalidate(self):
+        '''
+        Invalida la información de los objetos de la escena y las colecciones de objetos. Se invoca
+        automáticamente cuando cambia la escena del simulador (ver Client.check_scene())
+        '''
+        self.objects.invalidate()
+        self.robots.invalidate()
+        self.rearm_streams()
+        self.client.velocity_epoch += 1
+
+
+    def _poses_stream_command(self, opmode):
+        return binds.simxGetObjectGroupDataArrays(self.client.get_id(), binds.sim_handle_all, group_data_absolute_pose, opmode)
+
+    def start_poses_streaming(self):
+        '''
+        Crea un stream de datos entre cliente y servidor con la posición y orientación absolutas de todos los
+        objetos de la escena (ver get_poses())
+        '''
+        self.poses_streamed = True
+
+        try:
+            values = self._poses_stream_command(binds.simx_opmode_streaming)
+            code = values[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing object poses data stream on V-rep remote API server')
+
+    def _get_poses_data(self, streamed):
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+        code, handles, int_data, float_data, string_data = binds.simxGetObjectGroupDataArrays(self.client.get_id(),
+                                                            binds.sim_handle_all, group_data_absolute_pose, opmode)
+        if code != 0:
+            raise Exception('Error getting object poses from client buffer')
+
+        # Por cada objeto, float_data tiene 6 valores: posición (x, y, z) y orientación (ángulos de Euler alpha,
+        # beta y gamma)
+        return handles, float_data.reshape(-1, 6)
+
+    def get_poses(self, objects = None, relative_to = -1):
+        '''
+        Devuelve la posición y orientación de varios objetos de la escena con una única consulta a la API remota
+        (se usa simxGetObjectGroupData). La primera vez se hace una petición bloqueante al servidor y se inicia
+        un stream; las siguientes se obtienen del buffer del cliente.
+        e.g:
+        handles, positions, orientations = scene.get_poses()
+        :param objects: Es una lista de objetos (instancias de Object, sus nombres o sus identificadores). Si es None,
+        se devuelven las posiciones y orientaciones de todos los objetos de la escena.
+        :param relative_to: Es el objeto (una instancia de Object, su nombre o su identificador) respecto al
+        que se indican las posiciones y orientaciones. Por defecto es -1 (posiciones y orientaciones absolutas)
+        :return: Devuelve una tupla con tres arrays numpy: los identificadores de los objetos (int32, N), sus
+        posiciones (float32, (N, 3)) y sus orientaciones como ángulos de Euler alpha, beta, gamma (float32, (N, 3)).
+        Si se indica objects, las filas están en el mismo orden.
+        '''
+        import numpy as np
+
+        all_handles, all_poses = self._get_stream_value(self._get_poses_data, self.start_poses_streaming,
+                                                        'poses_streamed', 'initial_poses', require_running = False,
+                                                        command = self._poses_stream_command)
+        handles, poses = all_handles, all_poses
+        if not objects is None:
+            rows = self.objects._get_rows(all_handles, objects)
+            handles, poses = all_handles[rows], all_poses[rows]
+
+        positions = np.ascontiguousarray(poses[:, 0:3])
+        orientations = np.ascontiguousarray(poses[:, 3:6])
+
+        if not relative_to is None and relative_to != -1:
+            reference_pose = all_poses[self.objects._get_rows(all_handles, [relative_to])[0]]
+            reference_rotation = _euler_to_matrices(reference_pose[3:6].reshape(1, 3))[0]
+            # p' = R^T (p - p0), R' = R^T R
+            positions = ((positions - reference_pose[0:3]) @ reference_rotation).astype(np.float32)
+            orientations = _matrices_to_euler(reference_rotation.T @ _euler_to_matrices(orientations))
+
+        return handles, positions, orientations
+
+    def set_poses(self, objects, positions = None, orientations = None, wait = True):
+        '''
+        Establece la posición y/o la orientación absolutas de varios objetos de la escena con una única llamada
+        a un procedimiento remoto (la función lua set_poses). Todos los cambios se aplican en el mismo paso de
+        simulación.
+        e.g:
+        scene.set_poses(handles, positions, orientations)
+        :param objects: Es una lista de objetos (instancias de Object, sus nombres o sus identificadores) o un
+        array numpy con sus identificadores.
+        :param positions: Es un array (N, 3) con las nuevas posiciones, o None para no cambiarlas.
+        :param orientations: Es un array (N, 3) con las nuevas orientaciones (ángulos de Euler alpha, beta, gamma),
+        o None para no cambiarlas.
+        :param wait: Si es True (por defecto), espera a que el simulador aplique los cambios. Si es False, la
+        llamada se envía sin esperar respuesta.
+        '''
+        import numpy as np
+
+        handles = self.objects._get_handles(objects)
+        values = []
+        for poses in (positions, orientations):
+            if not poses is None:
+                poses = np.asarray(poses, dtype=np.float32)
+                if poses.shape != (len(handles), 3):
+                    raise Exception('Error setting object poses: Expected an array of shape ({}, 3)'.format(len(handles)))
+                poses = poses.ravel()
+            values.append(poses)
+
+        remote_methods = self.client.sync_remote_methods if wait else self.client.async_remote_methods
+        remote_methods.set_poses(handles, *values)
+
     def get_object(self, object_name):
         '''
         Devuelve un objeto de la escena cuyo nombre es que se indica como parámetro.
@@ -294,12 +1254,151 @@ class Scene:
 
 
 
+def _euler_to_matrices(orientations):
+    '''
+    Convierte un array (N, 3) de ángulos de Euler alpha, beta, gamma (convención de V-rep:
+    R = Rx(alpha) Ry(beta) Rz(gamma)) en un array (N, 3, 3) de matrices de rotación
+    '''
+    import numpy as np
+
+    orientations = np.asarray(orientations, dtype=np.float64)
+    ca, cb, cg = np.cos(orientations).T
+    sa, sb, sg = np.sin(orientations).T
+
+    matrices = np.empty((len(orientations), 3, 3))
+    matrices[:, 0, 0] = cb * cg
+    matrices[:, 0, 1] = -cb * sg
+    matrices[:, 0, 2] = sb
+    matrices[:, 1, 0] = ca * sg + sa * sb * cg
+    matrices[:, 1, 1] = ca * cg - sa * sb * sg
+    matrices[:, 1, 2] = -sa * cb
+    matrices[:, 2, 0] = sa * sg - ca * sb * cg
+    matrices[:, 2, 1] = sa * cg + ca * sb * sg
+    matrices[:, 2, 2] = ca * cb
+    return matrices
+
+def _matrices_to_euler(matrices):
+    '''
+    Operación inversa a _euler_to_matrices. Devuelve un array (N, 3) de tipo float32
+    '''
+    import numpy as np
+
+    alpha = np.arctan2(-matrices[:, 1, 2], matrices[:, 2, 2])
+    beta = np.arcsin(np.clip(matrices[:, 0, 2], -1, 1))
+    gamma = np.arctan2(-matrices[:, 0, 1], matrices[:, 0, 0])
+    return np.stack([alpha, beta, gamma], axis=1).astype(np.float32)
+
+
+
+class SceneIndexCache:
+    '''
+    Guarda en disco la información de los objetos de la escena (la respuesta de get_objects_info) para no tener que
+    consultarla de nuevo en las siguientes conexiones a la misma escena. Hay un fichero por cada dirección de servidor.
+    La información guardada solo se usa si la huella de la escena coincide: el identificador de la escena que el
+    servidor indica en la cabecera de sus mensajes (simx_headeroffset_scene_id) y un hash de los identificadores y
+    nombres de todos los objetos de la escena (el tipo de un objeto no cambia mientras conserve su identificador).
+    Calcular la huella solo requiere una consulta (simxGetObjectGroupData)
+    '''
+    def __init__(self, client, directory = None):
+        '''
+        Inicializa la instancia.
+        :param client: Es una instancia de la clase Client.
+        :param directory: Es el directorio donde se guardan los ficheros. Por defecto ~/.cache/pyvrepclient
+        '''
+        from hashlib import sha1
+
+        self.client = client
+        self.directory = directory if not directory is None else join(expanduser('~'), '.cache', 'pyvrepclient')
+        self.path = join(self.directory, sha1(client.address.encode('utf-8')).hexdigest() + '.json')
+        self.cached_fingerprint = None
+
+    def fingerprint(self, refresh = False):
+        '''
+        Calcula la huella de la escena cargada actualmente en el simulador. Se calcula solo una vez, salvo que
+        refresh sea True.
+        '''
+        from hashlib import sha1
+
+        if self.cached_fingerprint is None or refresh:
+            client_id = self.client.get_id()
+            code, object_handlers, ints, floats, object_names = binds.simxGetObjectGroupData(client_id,
+                binds.sim_appobj_object_type, group_data_object_name, binds.simx_opmode_blocking)
+            if code != 0:
+                raise Exception('Failed to get V-rep scene fingerprint')
+            code, scene_id = binds.simxGetInMessageInfo(client_id, binds.simx_headeroffset_scene_id)
+
+            # Los nombres se separan con '\0', que no puede aparecer en ellos
+            objects_hash = sha1('\0'.join('{},{}'.format(object_handler, object_name)
+                                          for object_handler, object_name
+                                          in zip(object_handlers, object_names)).encode('utf-8')).hexdigest()
+            self.cached_fingerprint = '{}:{}:{}'.format(scene_id, len(object_handlers), objects_hash)
+        return self.cached_fingerprint
+
+    def load(self):
+        '''
+        Devuelve la información de los objetos de la escena guardada en disco, o None si no hay información
+        guardada para esta escena.
+        '''
+        try:
+            with open(self.path, 'r') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or not isinstance(data.get('objects_info'), list):
+            return None
+        if data.get('fingerprint') != self.fingerprint():
+            return None
+        try:
+            return [tuple(object_info) for object_info in data['objects_info']]
+        except TypeError:
+            return None
+
+    def save(self, objects_info):
+        '''
+        Guarda en disco la información de los objetos de la escena. Los errores al escribir el fichero se ignoran.
+        '''
+        data = {'address' : self.client.address, 'fingerprint' : self.fingerprint(), 'objects_info' : list(objects_info)}
+        try:
+            makedirs(self.directory, exist_ok = True)
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w') as file:
+                json.dump(data, file)
+            replace(temp_path, self.path)
+        except OSError:
+            pass
+
+    def clear(self):
+        '''
+        Borra la información guardada en disco para este servidor.
+        '''
+        self.cached_fingerprint = None
+        try:
+            remove(self.path)
+        except OSError:
+            pass
+
+
+
 class ObjectsProxy:
     '''
     Clase auxiliar usada por la clase Scene para obtener información de los objetos de la escena V-rep.
+
+    Por defecto, se consulta la información de todos los objetos de la escena al crear la instancia. En modo
+    lazy, cada objeto se consulta la primera vez que se accede a él por su nombre (con simxGetObjectHandle y
+    una consulta de su tipo); los nombres que no existen también se recuerdan para no volver a consultarlos.
+    La información de todos los objetos solo se consulta al invocar get_all(), get_all_of_type(), al iterar
+    o al invocar load_all()
+
+    La información de los objetos se guarda por columnas: los identificadores (object_handles) y los tipos
+    (object_type_codes, el tipo de objeto de la API remota) en arrays compactos, los nombres en una lista y un
+    diccionario con la fila de cada nombre (object_rows). Después de consultar todos los objetos, las filas
+    están ordenadas por tipo, de forma que los objetos de cada tipo ocupan un rango de filas consecutivas
+    (type_ranges) y las consultas por tipo son cortes de las columnas. También se construye un índice con los
+    sufijos '#n' de los objetos duplicados (name_suffixes) para las colecciones de objetos duplicadas.
     '''
-    def __init__(self, client):
+    def __init__(self, client, lazy = False):
         self.client = client
+        self.lazy = lazy
 
         self.cached_objects = {}
         self.bind_object_types = {
@@ -312,37 +1411,189 @@ class ObjectsProxy:
             binds.sim_object_shape_type : Shape,
             binds.sim_object_light_type : Light
         }
-        objects_info = self.client.sync_remote_methods.get_objects_info()
-        objects_info = [(object_handler, object_name, object_type) for object_handler, object_name, object_type in objects_info if object_type in self.bind_object_types]
-
-        self.object_handlers = dict([(object_name, object_handler) for object_handler, object_name, object_type in objects_info])
-        self.object_types = dict([(object_name, self.bind_object_types[object_type]) for object_handler, object_name, object_type in objects_info])
-        self.objects_by_type = dict([(object_type, [object_name for object_name in self.object_types if self.object_types[object_name] == object_type])
-                                     for object_type in self.bind_object_types.values()])
 
-        self.joints = TypedObjectsProxy(self, Joint)
-        self.proximity_sensors = TypedObjectsProxy(self, ProximitySensor)
+        self.object_rows = {}
+        self.object_names = []
+        self.object_handles = array('i')
+        self.object_type_codes = array('b')
+        self.type_ranges = {}
+        self.name_suffixes = {}
+        self.missing_objects = set()
+        self.all_loaded = False
+        self.objects_info_future = None
+        self.stale_objects = {}
+
+        if not self.lazy:
+            self.load_all()
+
+        self.joints = JointsProxy(self)
+        self.proximity_sensors = ProximitySensorsProxy(self)
         self.vision_sensors = TypedObjectsProxy(self, VisionSensor)
         self.shapes = TypedObjectsProxy(self, Shape)
         self.lights = TypedObjectsProxy(self, Light)
 
 
+    def invalidate(self):
+        '''
+        Invalida la información de los objetos de la escena. Los objetos ya creados se guardan aparte y se
+        reutilizan si, al volver a consultarlos, su identificador y su tipo no han cambiado (sus streams se
+        vuelven a iniciar). Si no es lazy, se vuelve a consultar la información de todos los objetos.
+        '''
+        self.stale_objects.update(self.cached_objects)
+        for object in self.stale_objects.values():
+            if isinstance(object, DataStream):
+                object.rearm_streams()
+        self.proximity_sensors.rearm_streams()
+        self.joints.rearm_streams()
+
+        self.cached_objects = {}
+        self.object_rows = {}
+        self.object_names = []
+        self.object_handles = array('i')
+        self.object_type_codes = array('b')
+        self.type_ranges = {}
+        self.name_suffixes = {}
+        self.missing_objects = set()
+        self.all_loaded = False
+        self.objects_info_future = None
+
+        if not self.client.scene_cache is None:
+            self.client.scene_cache.cached_fingerprint = None
+
+        if not self.lazy:
+            self.load_all()
+
+
+    def load_all(self, wait = True):
+        '''
+        Consulta la información de todos los objetos de la escena V-rep.
+        :param wait: Si es True (por defecto), espera a la respuesta del simulador. Si es False, la consulta se
+        envía sin esperar (la respuesta se procesa en la siguiente llamada a load_all() o cuando se necesite
+        la información de todos los objetos)
+        '''
+        if self.all_loaded:
+            return
+
+        scene_cache = self.client.scene_cache
+        if self.objects_info_future is None:
+            objects_info = scene_cache.load() if not scene_cache is None else None
+            if not objects_info is None:
+                self._set_objects_info(objects_info)
+                return
+            if wait:
+                objects_info = self.client.sync_remote_methods.get_objects_info()
+                if not scene_cache is None:
+                    scene_cache.save(objects_info)
+                self._set_objects_info(objects_info)
+                return
+            self.objects_info_future = self.client.future_remote_methods.get_objects_info()
+
+        if wait or self.objects_info_future.done():
+            objects_info = self.objects_info_future.result()
+            self.objects_info_future = None
+            if not scene_cache is None:
+                scene_cache.save(objects_info)
+            self._set_objects_info(objects_info)
+
+    def _set_objects_info(self, objects_info):
+        # Ordenamos las filas por tipo (y por identificador dentro de cada tipo)
+        objects_info = sorted((object_type, object_handler, object_name) for object_handler, object_name, object_type in objects_info if object_type in self.bind_object_types)
+
+        self.object_names = [object_name for object_type, object_handler, object_name in objects_info]
+        self.object_handles = array('i', [object_handler for object_type, object_handler, object_name in objects_info])
+        self.object_type_codes = array('b', [object_type for object_type, object_handler, object_name in objects_info])
+        self.object_rows = dict(zip(self.object_names, range(0, len(self.object_names))))
+
+        self.type_ranges = {}
+        for row, object_type in enumerate(self.object_type_codes):
+            start, stop = self.type_ranges.get(object_type, (row, row))
+            self.type_ranges[object_type] = (start, row + 1)
+
+        # Los objetos duplicados en V-rep tienen el nombre del original seguido de '#n' (n = 0, 1, 2, ...)
+        name_suffixes = {}
+        for object_name in self.object_names:
+            base_name, separator, suffix = object_name.rpartition('#')
+            if separator and suffix.isdigit():
+                name_suffixes.setdefault(base_name, []).append(int(suffix))
+        self.name_suffixes = dict([(base_name, sorted(suffixes)) for base_name, suffixes in name_suffixes.items()])
+
+        self.missing_objects = set()
+        self.all_loaded = True
+
+    def _get_type_ranges(self, object_type):
+        '''
+        Devuelve una lista con los rangos de filas (inicio, fin) de los objetos del tipo indicado (o sus subclases).
+        Los rangos consecutivos se unen. Solo es válido después de consultar todos los objetos (ver load_all())
+        '''
+        ranges = []
+        for bind_object_type, (start, stop) in sorted(self.type_ranges.items()):
+            if not issubclass(self.bind_object_types[bind_object_type], object_type):
+                continue
+            if len(ranges) > 0 and ranges[-1][1] == start:
+                ranges[-1] = (ranges[-1][0], stop)
+            else:
+                ranges.append((start, stop))
+        return ranges
+
+    def _resolve(self, object_name):
+        '''
+        Consulta el identificador y el tipo de un objeto por su nombre (en modo lazy)
+        :return: Devuelve True si el objeto existe y es de uno de los tipos soportados, False en caso contrario.
+        '''
+        if object_name in self.object_rows:
+            return True
+        if self.all_loaded or object_name in self.missing_objects:
+            return False
+
+        code, object_handler = binds.simxGetObjectHandle(self.client.get_id(), object_name, binds.simx_opmode_blocking)
+        object_type = None
+        if code == 0:
+            object_type, joint_type = self.client.sync_remote_methods.get_object_type(object_handler)
+            if object_type == binds.sim_object_joint_type:
+                object_type = joint_type
+            elif object_type in (binds.sim_joint_revolute_subtype, binds.sim_joint_prismatic_subtype, binds.sim_joint_spherical_subtype):
+                object_type = None
+
+        if not object_type in self.bind_object_types:
+            self.missing_objects.add(object_name)
+            return False
+
+        self.object_rows[object_name] = len(self.object_names)
+        self.object_names.append(object_name)
+        self.object_handles.append(object_handler)
+        self.object_type_codes.append(object_type)
+        return True
+
+
     def get(self, object_name):
         '''
         Consulta un objeto de la escena V-rep cuyo nombre es el que se indica como argumento.
         :param object_name:
         :return: Devuelve un objeto cuyo nombre es el que se indica, o None si no existe ningún objeto con ese nombre
         '''
+        self.client.check_scene()
         if object_name in self.cached_objects:
             return self.cached_objects[object_name]
 
         if not self.has(object_name):
             return None
-        object_handler = self.object_handlers[object_name]
-        object_type = self.object_types[object_name]
+        return self._get_row(self.object_rows[object_name])
+
+    def _get_row(self, row):
+        '''
+        Devuelve el objeto de la fila indicada (se crea la primera vez que se accede a él)
+        '''
+        object_name = self.object_names[row]
+        if object_name in self.cached_objects:
+            return self.cached_objects[object_name]
 
-        cls = object_type
-        object = cls(client = self.client, id = object_handler)
+        object_handler = self.object_handles[row]
+        object_type = self.bind_object_types[self.object_type_codes[row]]
+
+        object = self.stale_objects.pop(object_name, None)
+        if object is None or object.get_id() != object_handler or type(object) != object_type:
+            cls = object_type
+            object = cls(client = self.client, id = object_handler)
         self.cached_objects[object_name] = object
 
         return object
@@ -353,7 +1604,12 @@ class ObjectsProxy:
         :param object_name:
         :return:
         '''
-        return object_name in self.object_handlers
+        self.client.check_scene()
+        if object_name in self.object_rows:
+            return True
+        if not self.objects_info_future is None:
+            self.load_all(wait = False)
+        return self._resolve(object_name)
 
 
 
@@ -365,7 +1621,77 @@ class ObjectsProxy:
         :param object_type:
         :return:
         '''
-        return [self.get(object_name) for object_name in self.objects_by_type[object_type]]
+        self.load_all()
+        return [self._get_row(row) for start, stop in self._get_type_ranges(object_type) for row in range(start, stop)]
+
+    def _get_handles(self, objects):
+        '''
+        Devuelve un array numpy de tipo int32 con los identificadores de los objetos indicados.
+        :param objects: Es una lista de objetos (instancias de Object, sus nombres o sus identificadores) o un array
+        numpy de identificadores.
+        '''
+        import numpy as np
+
+        if isinstance(objects, np.ndarray):
+            return objects.astype(np.int32, copy=False).ravel()
+        return np.array([self[object].get_id() if isinstance(object, str) else
+                         object.get_id() if isinstance(object, Object) else object
+                         for object in objects], dtype=np.int32)
+
+    def _get_rows(self, handles, objects):
+        '''
+        Devuelve un array con los índices de los objetos indicados en el array de identificadores handles.
+        :param objects: Es una lista de objetos (instancias de Object, sus nombres o sus identificadores)
+        '''
+        import numpy as np
+
+        object_handlers = self._get_handles(objects)
+        sorter = np.argsort(handles)
+        rows = sorter[np.clip(np.searchsorted(handles, object_handlers, sorter=sorter), 0, max(len(handles) - 1, 0))]
+        if len(object_handlers) > 0 and (len(handles) == 0 or np.any(handles[rows] != object_handlers)):
+            raise Exception('Some of the objects are missing in the reply from V-rep remote API server')
+        return rows
+
+    def get_name_suffixes(self, object_name):
+        '''
+        Devuelve los sufijos de los duplicados del objeto indicado: una lista ordenada con los números n de los
+        objetos de la escena llamados object_name + '#n'
+        '''
+        self.load_all()
+        return self.name_suffixes.get(object_name, [])
+
+    def get_handles_of_type(self, object_type):
+        '''
+        Devuelve los identificadores de todos los objetos de un tipo específico, sin crear los objetos.
+        :return: Devuelve un array numpy de tipo int32. Si los objetos del tipo indicado ocupan filas consecutivas
+        (siempre salvo que se pidan varios tipos no consecutivos), es un corte de la columna de identificadores
+        (no se copia)
+        '''
+        import numpy as np
+
+        self.load_all()
+        handles = np.frombuffer(self.object_handles, dtype=np.int32) if len(self.object_handles) > 0 else np.empty((0,), dtype=np.int32)
+        ranges = self._get_type_ranges(object_type)
+        if len(ranges) == 0:
+            return handles[0:0]
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            return handles[start:stop]
+        return np.concatenate([handles[start:stop] for start, stop in ranges])
+
+    def get_names_of_type(self, object_type):
+        '''
+        Devuelve los nombres de todos los objetos de un tipo específico, sin crear los objetos.
+        '''
+        self.load_all()
+        return [object_name for start, stop in self._get_type_ranges(object_type) for object_name in self.object_names[start:stop]]
+
+    def count_of_type(self, object_type):
+        '''
+        Devuelve el número de objetos de un tipo específico.
+        '''
+        self.load_all()
+        return sum(stop - start for start, stop in self._get_type_ranges(object_type))
 
 
     def get_all(self):
@@ -373,7 +1699,8 @@ class ObjectsProxy:
         Devuelve todos los objetos de la escena V-rep
         :return:
         '''
-        return [self.get(object_name) for object_name in self.object_handlers]
+        self.load_all()
+        return [self._get_row(row) for row in range(0, len(self.object_names))]
 
     def __iter__(self):
         return iter(self.get_all())
@@ -415,6 +1742,19 @@ class TypedObjectsProxy:
     def get_all(self):
         return self.objects.get_all_of_type(self.object_type)
 
+    def get_handles(self):
+        '''
+        Devuelve un array numpy de tipo int32 con los identificadores de todos los objetos (ver
+        ObjectsProxy.get_handles_of_type)
+        '''
+        return self.objects.get_handles_of_type(self.object_type)
+
+    def get_names(self):
+        '''
+        Devuelve los nombres de todos los objetos.
+        '''
+        return self.objects.get_names_of_type(self.object_type)
+
     def __getitem__(self, object_name):
         object = self.get(object_name)
         if object is None:
@@ -427,10 +1767,258 @@ class TypedObjectsProxy:
     def __iter__(self):
         return iter(self.get_all())
 
+    def __len__(self):
+        return self.objects.count_of_type(self.object_type)
+
     def __contains__(self, object_name):
         return self.has(object_name)
 
 
+class ProximitySensorsProxy(TypedObjectsProxy, DataStream):
+    '''
+    Es igual que TypedObjectsProxy para objetos del tipo ProximitySensor, pero además permite obtener las
+    mediciones de todos los sensores de proximidad de la escena con una única consulta a la API remota
+    (se usa simxGetObjectGroupData)
+    '''
+    def __init__(self, objects):
+        super().__init__(objects, ProximitySensor)
+        self.client = objects.client
+        self.streamed = False
+        self.initial_value = None
+
+    def _stream_command(self, opmode):
+        return binds.simxGetObjectGroupDataArrays(self.client.get_id(), binds.sim_object_proximitysensor_type, group_data_proximity_sensor, opmode)
+
+    def start_streaming(self):
+        self.streamed = True
+
+        try:
+            values = self._stream_command(binds.simx_opmode_streaming)
+            code = values[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing proximity sensors data stream on V-rep remote API server')
+
+    def _get_data(self, streamed):
+        import numpy as np
+
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+        code, handles, int_data, float_data, string_data = binds.simxGetObjectGroupDataArrays(self.client.get_id(),
+                                                            binds.sim_object_proximitysensor_type,
+                                                            group_data_proximity_sensor, opmode)
+        if code != 0:
+            raise Exception('Error getting proximity sensors data from client buffer')
+
+        # Por cada sensor, int_data tiene 2 valores (estado de detección, objeto detectado) y
+        # float_data tiene 6 (punto detectado y vector normal de la superficie detectada)
+        detected_state = int_data.reshape(-1, 2)[:, 0] != 0
+        detected_point = float_data.reshape(-1, 6)[:, 0:3]
+        distances = np.where(detected_state, np.linalg.norm(detected_point, axis=1), np.inf).astype(np.float32)
+        return handles, distances
+
+    def get_handles_and_values(self):
+        '''
+        Devuelve las mediciones de todos los sensores de proximidad de la escena.
+        La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :return: Devuelve una tupla con dos arrays numpy: los identificadores de los sensores (int32) y sus
+        mediciones (float32, en metros, o inf si no se detecta ningún objeto)
+        '''
+        return self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command)
+
+    def get_values_by_handle(self):
+        '''
+        Devuelve las mediciones de todos los sensores de proximidad de la escena.
+        La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :return: Devuelve un diccionario cuyas claves son los identificadores de los sensores y los valores, sus
+        mediciones (en metros, o float('inf') si no se detecta ningún objeto)
+        '''
+        handles, distances = self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command)
+        return dict(zip(handles.tolist(), distances.tolist()))
+
+    def get_values(self, sensors = None):
+        '''
+        Devuelve las mediciones de varios sensores de proximidad con una única consulta a la API remota.
+        La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :param sensors: Es una lista de sensores de proximidad (instancias de ProximitySensor o sus nombres).
+        Si es None, se devuelven las mediciones de todos los sensores de la escena.
+        :return: Devuelve un array numpy de tipo float32 con las mediciones de los sensores, en el mismo orden
+        que se indican en sensors (en metros, o inf si no se detecta ningún objeto)
+        '''
+        handles, distances = self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command)
+        if sensors is None:
+            return distances
+        return distances[self.objects._get_rows(handles, sensors)]
+
+
+class JointsProxy(TypedObjectsProxy, DataStream):
+    '''
+    Es igual que TypedObjectsProxy para objetos del tipo Joint, pero además permite obtener el estado (posición
+    y fuerza o par) de todas las uniones de la escena con una única consulta a la API remota
+    (se usa simxGetObjectGroupData)
+    '''
+    def __init__(self, objects):
+        super().__init__(objects, Joint)
+        self.client = objects.client
+        self.streamed = False
+        self.initial_value = None
+
+    def _stream_command(self, opmode):
+        return binds.simxGetObjectGroupDataArrays(self.client.get_id(), binds.sim_object_joint_type, group_data_joint_state, opmode)
+
+    def start_streaming(self):
+        self.streamed = True
+
+        try:
+            values = self._stream_command(binds.simx_opmode_streaming)
+            code = values[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing joints data stream on V-rep remote API server')
+
+    def _get_data(self, streamed):
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+        code, handles, int_data, float_data, string_data = binds.simxGetObjectGroupDataArrays(self.client.get_id(),
+                                                            binds.sim_object_joint_type,
+                                                            group_data_joint_state, opmode)
+        if code != 0:
+            raise Exception('Error getting joints data from client buffer')
+
+        # Por cada unión, float_data tiene 2 valores (posición y fuerza o par)
+        return handles, float_data.reshape(-1, 2)
+
+    def get_states(self, joints = None):
+        '''
+        Devuelve el estado de varias uniones con una única consulta a la API remota.
+        La simulación debe estar ejecutandose.
+        :param joints: Es una lista de uniones (instancias de Joint, sus nombres o sus identificadores) o un array
+        numpy de identificadores. Si es None, se devuelve el estado de todas las uniones de la escena.
+        :return: Devuelve un array numpy (N, 2) de tipo float32 con la posición (en metros o radianes) y la fuerza
+        o par de cada unión, en el mismo orden que se indican en joints
+        '''
+        handles, states = self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command)
+        if joints is None:
+            return states
+        return states[self.objects._get_rows(handles, joints)]
+
+    def get_handles_and_states(self):
+        '''
+        Devuelve el estado de todas las uniones de la escena.
+        :return: Devuelve una tupla con dos arrays numpy: los identificadores de las uniones (int32) y su
+        estado (float32, (N, 2), ver get_states())
+        '''
+        return self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command)
+
+    def group(self, joints = None):
+        '''
+        Devuelve un grupo de uniones (una instancia de JointGroup)
+        :param joints: Es una lista de uniones (instancias de Joint o sus nombres). Si es None, el grupo
+        contiene todas las uniones de la escena.
+        '''
+        if joints is None:
+            joints = self.get_all()
+        return JointGroup(self.objects, [self[joint] if isinstance(joint, str) else joint for joint in joints])
+
+
+
+class JointGroup:
+    '''
+    Representa un grupo de uniones de la escena cuyo estado se obtiene con una única consulta a la API remota
+    (ver JointsProxy.get_states) y cuyas velocidades se establecen en un único paquete (ver Client.batch())
+    '''
+    def __init__(self, objects, joints):
+        '''
+        Inicializa la instancia.
+        :param objects: Es una instancia de ObjectsProxy
+        :param joints: Es una lista de uniones (instancias de Joint)
+        '''
+        import numpy as np
+
+        self.objects = objects
+        self.client = objects.client
+        self.joints = list(joints)
+        self.handles = np.array([joint.get_id() for joint in self.joints], dtype=np.int32)
+
+    def __len__(self):
+        return len(self.joints)
+
+    def __iter__(self):
+        return iter(self.joints)
+
+    def __getitem__(self, index):
+        return self.joints[index]
+
+    def get_states(self):
+        '''
+        Devuelve la posición y la fuerza (o par) de todas las uniones del grupo.
+        :return: Devuelve un array numpy (N, 2) de tipo float32, en el mismo orden que las uniones del grupo.
+        '''
+        return self.objects.joints.get_states(self.handles)
+
+    def get_positions(self):
+        '''
+        Devuelve la posición de todas las uniones del grupo (un array numpy de tipo float32)
+        '''
+        return self.get_states()[:, 0]
+
+    def get_forces(self):
+        '''
+        Devuelve la fuerza (o par) de todas las uniones del grupo (un array numpy de tipo float32)
+        '''
+        return self.get_states()[:, 1]
+
+    def get_velocities(self):
+        '''
+        Devuelve la velocidad de todas las uniones del grupo (un array numpy de tipo float32). simxGetObjectGroupData
+        no permite consultar la velocidad de las uniones, así que se obtiene del stream de cada unión (ver
+        Joint.get_velocity). Solo la primera lectura de cada unión es una petición bloqueante.
+        '''
+        import numpy as np
+        return np.array([joint.get_velocity() for joint in self.joints], dtype=np.float32)
+
+    def set_velocities(self, velocities):
+        '''
+        Establece la velocidad de todas las uniones del grupo. Todos los comandos se envían al simulador en
+        un único paquete (ver Client.batch())
+        :param velocities: Es una lista o array con la velocidad de cada unión, en el mismo orden que las uniones
+        del grupo.
+        '''
+        if len(velocities) != len(self.joints):
+            raise Exception('Expected {} joint velocities but got {}'.format(len(self.joints), len(velocities)))
+
+        with self.client.batch():
+            for joint, velocity in zip(self.joints, velocities):
+                joint.set_velocity(float(velocity))
+
+    def follow_trajectory(self, times, positions):
+        '''
+        Igual que Joint.follow_trajectory, pero todas las uniones del grupo siguen la trayectoria a la vez. Se
+        envía en una única llamada.
+        :param times: Son los instantes de tiempo de la trayectoria (T valores, en segundos, en orden creciente)
+        :param positions: Es un array (T, número de uniones) con las posiciones de las uniones en cada instante,
+        en el mismo orden que las uniones del grupo.
+        :return: Devuelve una instancia de Trajectory
+        '''
+        return Trajectory.upload(self.client, self.handles, times, positions)
+
+    @property
+    def positions(self):
+        return self.get_positions()
+
+    @property
+    def forces(self):
+        return self.get_forces()
+
+    @property
+    def velocities(self):
+        return self.get_velocities()
+
+    @velocities.setter
+    def velocities(self, velocities):
+        self.set_velocities(velocities)
+
+
 class ObjectsCollectionsProxy:
     '''
     Clase usada para acceder a colleciones de objetos de la escena V-rep, usada por la clase Scene
@@ -440,7 +2028,14 @@ class ObjectsCollectionsProxy:
         self.collection_classes = collection_classes
         self.cached = {}
 
+    def invalidate(self):
+        '''
+        Invalida las colecciones de objetos creadas. Se vuelven a crear la próxima vez que se accede a ellas.
+        '''
+        self.cached = {}
+
     def get(self, collection_name):
+        self.scene.client.check_scene()
         if not collection_name in self.collection_classes:
             return None
         if collection_name in self.cached:
@@ -535,13 +2130,31 @@ class ObjectsCollection:
             object_names = self.name_mapping.keys() if isinstance(self.name_mapping, dict) else range(0, len(self.name_mapping))
             return [self[object_name] for object_name in object_names]
 
+        def get_handles(self):
+            import numpy as np
+            return np.array([object.get_id() for object in self.get_all()], dtype=np.int32)
+
+        def get_names(self):
+            return list(self.name_mapping.values()) if isinstance(self.name_mapping, dict) else list(self.name_mapping)
+
         def __len__(self):
             return len(self.name_mapping)
 
 
     def __init__(self, scene, duplicate_offset = None):
+        '''
+        Inicializa la instancia.
+        :param scene: Es la escena (una instancia de Scene)
+        :param duplicate_offset: Si es None, la colección es la original (su objeto raíz se llama root). En caso
+        contrario, la colección es el duplicado cuyo objeto raíz se llama root + '#' + str(duplicate_offset - 1)
+        '''
         self.duplicate_offset = duplicate_offset
         self.scene = scene
+        self.duplicate_offsets = None
+        self.duplicates = {}
+        self.state_handles = None
+        self.cached_swarm = None
+        self.cached_joint_group = None
 
         try:
             if self.root is None:
@@ -562,36 +2175,245 @@ class ObjectsCollection:
         self.shapes = self.ObjectsProxy(self.scene.objects, Shape, self.__class__.shapes, self.duplicate_offset)
 
 
+    def _get_state_handles(self):
+        '''
+        Devuelve una tupla con los identificadores de los sensores de proximidad y de las uniones de la colección
+        (arrays numpy de tipo int32, en el mismo orden en el que se definen en la clase). Solo se calcula una vez.
+        '''
+        if self.state_handles is None:
+            self.state_handles = (self.proximity_sensors.get_handles(), self.joints.get_handles())
+        return self.state_handles
+
+    def read_state(self):
+        '''
+        Devuelve el estado de la colección en un único array: las mediciones de todos los sensores de proximidad
+        y el estado de todas las uniones. Se obtienen con una consulta a la API remota para todos los sensores
+        de proximidad y otra para todas las uniones de la escena (ver ProximitySensorsProxy.get_values y
+        JointsProxy.get_states). La simulación debe estar ejecutandose.
+        :return: Devuelve un array numpy de tipo float32. Los primeros valores son las mediciones de los sensores de
+        proximidad (en metros, o inf si no se detecta ningún objeto) y a continuación, por cada unión, su posición
+        y su fuerza o par. Los sensores y las uniones están en el mismo orden en el que se definen en la clase.
+        '''
+        import numpy as np
+
+        proximity_handles, joint_handles = self._get_state_handles()
+        state = np.empty((len(proximity_handles) + 2 * len(joint_handles),), dtype=np.float32)
+        if len(proximity_handles) > 0:
+            state[0:len(proximity_handles)] = self.scene.proximity_sensors.get_values(proximity_handles)
+        if len(joint_handles) > 0:
+            state[len(proximity_handles):] = self.scene.joints.get_states(joint_handles).ravel()
+        return state
+
+    def write_joint_velocities(self, velocities):
+        '''
+        Establece la velocidad de todas las uniones de la colección. Todos los comandos se envían al simulador en
+        un único paquete (ver Client.batch()), pero se envía un comando por cada unión. Para establecer la velocidad
+        de las uniones de todos los robots de la escena con una única llamada, ver swarm()
+        :param velocities: Es una lista o array con la velocidad de cada unión (en metros/segundo o radianes/segundo),
+        en el mismo orden en el que se definen en la clase.
+        '''
+        self.get_joint_group().set_velocities(velocities)
+
+    def get_joint_group(self):
+        '''
+        Devuelve un grupo (una instancia de JointGroup) con todas las uniones de la colección, en el mismo orden
+        en el que se definen en la clase. Permite leer la posición y la fuerza de todas ellas con una única
+        consulta a la API remota.
+        '''
+        if self.cached_joint_group is None:
+            self.cached_joint_group = JointGroup(self.scene.objects, self.joints.get_all())
+        return self.cached_joint_group
+
+    def read_joint_states(self):
+        '''
+        Devuelve la posición y la fuerza (o par) de todas las uniones de la colección (ver JointGroup.get_states)
+        '''
+        return self.get_joint_group().get_states()
+
+    def swarm(self):
+        '''
+        Devuelve un enjambre (una instancia de Swarm) con todas las colecciones de este tipo de la escena (la
+        original y sus duplicados), para leer sus sensores y establecer la velocidad de sus motores con una única
+        consulta a la API remota por ciclo de control, independientemente del número de robots.
+        e.g:
+        swarm = scene.robots.epuck.swarm()
+        swarm.velocities = controller(swarm.proximity)
+        '''
+        if not self.duplicate_offset is None:
+            raise NotImplementedError()
+        if self.cached_swarm is None:
+            self.cached_swarm = Swarm(self)
+        return self.cached_swarm
+
+    def _get_duplicate_offsets(self):
+        '''
+        Devuelve la lista de duplicate_offset de todas las colecciones de este tipo que hay en la escena: la
+        original (None) seguida de los duplicados, en orden. Se obtiene del índice de sufijos '#n' de la escena
+        (ver ObjectsProxy.get_name_suffixes) y solo se calcula una vez.
+        '''
+        if self.duplicate_offsets is None:
+            suffixes = self.scene.objects.get_name_suffixes(self.root)
+            self.duplicate_offsets = [None] + [suffix + 1 for suffix in suffixes]
+        return self.duplicate_offsets
+
+    def __len__(self):
+        if not self.duplicate_offset is None:
+            raise NotImplementedError()
+        return len(self._get_duplicate_offsets())
+
+    def __bool__(self):
+        # Las colecciones siempre son verdaderas (sin __bool__, se usaría __len__, que falla en los duplicados)
+        return True
+
     def __getitem__(self, index):
         if not self.duplicate_offset is None:
             raise NotImplementedError()
 
+        duplicate_offsets = self._get_duplicate_offsets()
+        if index < 0:
+            index += len(duplicate_offsets)
         if index == 0:
             return self
-        try:
-            cls = self.__class__
-            duplicate = cls(self.scene, duplicate_offset = index)
-            return duplicate
-        except:
+        if not 0 < index < len(duplicate_offsets):
             raise ObjectsCollectionNotFoundError(self.__class__.__name__)
 
-
-    class Iterator:
-        def __init__(self, collection):
-            self.collection = collection
-            self.index = 0
-
-        def __next__(self):
+        duplicate_offset = duplicate_offsets[index]
+        if not duplicate_offset in self.duplicates:
             try:
-                item = self.collection[self.index]
-                self.index += 1
-                return item
+                cls = self.__class__
+                self.duplicates[duplicate_offset] = cls(self.scene, duplicate_offset = duplicate_offset)
             except:
-                raise StopIteration
+                raise ObjectsCollectionNotFoundError(self.__class__.__name__)
+        return self.duplicates[duplicate_offset]
 
     def __iter__(self):
         if not self.duplicate_offset is None:
             raise NotImplementedError()
-        return self.Iterator(self)
+        for index in range(0, len(self)):
+            yield self[index]
+
+
+class Swarm:
+    '''
+    Representa todas las instancias de una colección de objetos de la escena (p.ej todos los robots ePuck).
+    Las mediciones de los sensores de proximidad y el estado de las uniones de todos los robots se obtienen de
+    un único stream (ver ProximitySensorsProxy y JointsProxy) y las velocidades de todas las uniones se
+    establecen con una única llamada a un procedimiento remoto (la función lua set_joint_velocities)
+    Las filas de las matrices corresponden a los robots (en el mismo orden que al iterar la colección) y las
+    columnas a sus sensores o uniones (en el mismo orden en el que se definen en la clase de la colección)
+    '''
+    def __init__(self, collection):
+        '''
+        Inicializa la instancia.
+        :param collection: Es la colección original (una instancia de ObjectsCollection)
+        '''
+        import numpy as np
+
+        self.scene = collection.scene
+        self.robots = list(collection)
+
+        self.proximity_handles = np.array([robot.proximity_sensors.get_handles() for robot in self.robots], dtype=np.int32).reshape(len(self.robots), -1)
+        self.joint_handles = np.array([robot.joints.get_handles() for robot in self.robots], dtype=np.int32).reshape(len(self.robots), -1)
+        self.last_velocities = np.zeros(self.joint_handles.shape, dtype=np.float32)
+
+        # Filas de las mediciones de cada sensor en la última respuesta del servidor (se recalculan si cambian
+        # los identificadores de la respuesta)
+        self.proximity_reply_handles, self.proximity_rows = None, None
+        self.joint_reply_handles, self.joint_rows = None, None
+
+    def __len__(self):
+        return len(self.robots)
+
+    def __iter__(self):
+        return iter(self.robots)
+
+    def __getitem__(self, index):
+        return self.robots[index]
+
+    def _get_rows(self, reply_handles, cached_reply_handles, cached_rows, handles):
+        import numpy as np
+
+        if cached_rows is None or len(reply_handles) != len(cached_reply_handles) or not np.array_equal(reply_handles, cached_reply_handles):
+            cached_rows = self.scene.objects._get_rows(reply_handles, handles.ravel()).reshape(handles.shape)
+        return cached_rows
+
+    def read_proximity(self):
+        '''
+        Devuelve las mediciones de los sensores de proximidad de todos los robots.
+        La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :return: Devuelve un array numpy de tipo float32 con dimensiones (número de robots, número de sensores).
+        Las mediciones están en metros (inf si no se detecta ningún objeto)
+        '''
+        handles, distances = self.scene.proximity_sensors.get_handles_and_values()
+        self.proximity_rows = self._get_rows(handles, self.proximity_reply_handles, self.proximity_rows, self.proximity_handles)
+        self.proximity_reply_handles = handles
+        return distances[self.proximity_rows]
+
+    def read_joint_states(self):
+        '''
+        Devuelve el estado de las uniones de todos los robots.
+        :return: Devuelve un array numpy de tipo float32 con dimensiones (número de robots, número de uniones, 2),
+        con la posición y la fuerza o par de cada unión.
+        '''
+        handles, states = self.scene.joints.get_handles_and_states()
+        self.joint_rows = self._get_rows(handles, self.joint_reply_handles, self.joint_rows, self.joint_handles)
+        self.joint_reply_handles = handles
+        return states[self.joint_rows]
+
+    def write_velocities(self, velocities):
+        '''
+        Establece la velocidad de las uniones de todos los robots con una única llamada a un procedimiento remoto.
+        El método vuelve sin esperar respuesta del simulador.
+        :param velocities: Es un array con dimensiones (número de robots, número de uniones) con las velocidades
+        (en metros/segundo o radianes/segundo)
+        '''
+        import numpy as np
+
+        velocities = np.asarray(velocities, dtype=np.float32)
+        if velocities.shape != self.joint_handles.shape:
+            raise Exception('Expected an array of joint velocities of shape {}'.format(self.joint_handles.shape))
+
+        # Igual que en Joint, solo se envían las velocidades que han cambiado respecto a la última enviada a cada
+        # unión (por este método o por Joint.set_velocity)
+        client = self.scene.client
+        joint_velocities, pending_velocities = client.joint_velocities, client.pending_velocities
+        handles, values = self.joint_handles.ravel().tolist(), velocities.ravel().tolist()
+        changed = []
+        for index, (handle, velocity) in enumerate(zip(handles, values)):
+            last = joint_velocities.get(handle)
+            if last is None or last[2] != client.velocity_epoch or abs(velocity - last[0]) > client.velocity_tolerance:
+                changed.append(index)
+            # Las velocidades pendientes de las uniones quedan reemplazadas por las nuevas
+            joint = pending_velocities.pop(handle, None)
+            if not joint is None:
+                joint.pending_velocity = None
+        self.last_velocities = velocities
+
+        if len(changed) == 0:
+            client.velocity_commands_suppressed += 1
+            return
+
+        client.async_remote_methods.set_joint_velocities(self.joint_handles.ravel()[changed], velocities.ravel()[changed])
+        now = monotonic()
+        for index in changed:
+            joint_velocities[handles[index]] = (values[index], now, client.velocity_epoch)
+        client.velocity_commands_sent += 1
+
+    @property
+    def proximity(self):
+        return self.read_proximity()
+
+    @property
+    def velocities(self):
+        '''
+        La propiedad velocities devuelve las últimas velocidades establecidas y permite establecer la velocidad
+        de todas las uniones (ver write_velocities)
+        '''
+        return self.last_velocities
+
+    @velocities.setter
+    def velocities(self, velocities):
+        self.write_velocities(velocities)
+
 
 import robots
\ No newline at end of file
@@ -53,113 +53,141 @@ except:
     raise Exception('V-Rep remote API could not be loaded succesfully. Tried to load it from "{}". File is missing or corrupted'.format(libfullpath))
 
 
+class _LazyFunction:
+    '''
+    Function of the remote API library whose ctypes prototype is created and whose symbol is resolved the first
+    time it is called. After that, the module global that references it is replaced by the real ctypes function
+    '''
+    def __init__(self, restype, argtypes, name, library):
+        self.restype = restype
+        self.argtypes = argtypes
+        self.name = name
+        self.library = library
+
+    def resolve(self):
+        function = ct.CFUNCTYPE(self.restype, *self.argtypes)((self.name, self.library))
+        globals()['c_' + self.name[len('simx'):]] = function
+        return function
+
+    def __call__(self, *args):
+        return self.resolve()(*args)
+
+def _lazy_cfunctype(restype, *argtypes):
+    '''
+    Same as ctypes.CFUNCTYPE, but the prototype returns a _LazyFunction
+    '''
+    def prototype(name_and_library):
+        name, library = name_and_library
+        return _LazyFunction(restype, argtypes, name, library)
+    return prototype
+
 #ctypes wrapper prototypes 
-c_GetJointPosition          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointPosition", libsimx))
-c_SetJointPosition          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointPosition", libsimx))
-c_GetJointMatrix            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointMatrix", libsimx))
-c_SetSphericalJointMatrix   = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetSphericalJointMatrix", libsimx))
-c_SetJointTargetVelocity    = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointTargetVelocity", libsimx))
-c_SetJointTargetPosition    = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointTargetPosition", libsimx))
-c_GetJointForce             = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointForce", libsimx))
-c_SetJointForce             = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointForce", libsimx))
-c_ReadForceSensor           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.c_int32)(("simxReadForceSensor", libsimx))
-c_BreakForceSensor          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxBreakForceSensor", libsimx))
-c_ReadVisionSensor          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.POINTER(ct.c_float)), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxReadVisionSensor", libsimx))
-c_GetObjectHandle           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectHandle", libsimx))
-c_GetVisionSensorImage      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_byte)), ct.c_ubyte, ct.c_int32)(("simxGetVisionSensorImage", libsimx))
-c_SetVisionSensorImage      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_byte), ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetVisionSensorImage", libsimx))
-c_GetVisionSensorDepthBuffer= ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)), ct.c_int32)(("simxGetVisionSensorDepthBuffer", libsimx))
-c_GetObjectChild            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectChild", libsimx))
-c_GetObjectParent           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectParent", libsimx))
-c_ReadProximitySensor       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_float), ct.c_int32)(("simxReadProximitySensor", libsimx))
-c_LoadModel                 = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.POINTER(ct.c_int32), ct.c_int32)(("simxLoadModel", libsimx))
-c_LoadUI                    = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxLoadUI", libsimx))
-c_LoadScene                 =  ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.c_int32)(("simxLoadScene", libsimx))
-c_StartSimulation           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32)(("simxStartSimulation", libsimx))
-c_PauseSimulation           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32)(("simxPauseSimulation", libsimx))
-c_StopSimulation            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32)(("simxStopSimulation", libsimx))
-c_GetUIHandle               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIHandle", libsimx))
-c_GetUISlider               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUISlider", libsimx))
-c_SetUISlider               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetUISlider", libsimx))
-c_GetUIEventButton          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIEventButton", libsimx))
-c_GetUIButtonProperty       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIButtonProperty", libsimx))
-c_SetUIButtonProperty       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetUIButtonProperty", libsimx))
-c_AddStatusbarMessage       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxAddStatusbarMessage", libsimx))
-c_AuxiliaryConsoleOpen      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.c_int32)(("simxAuxiliaryConsoleOpen", libsimx))
-c_AuxiliaryConsoleClose     = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxAuxiliaryConsoleClose", libsimx))
-c_AuxiliaryConsolePrint     = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxAuxiliaryConsolePrint", libsimx))
-c_AuxiliaryConsoleShow      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxAuxiliaryConsoleShow", libsimx))
-c_GetObjectOrientation      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectOrientation", libsimx))
-c_GetObjectPosition         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectPosition", libsimx))
-c_SetObjectOrientation      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetObjectOrientation", libsimx))
-c_SetObjectPosition         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetObjectPosition", libsimx))
-c_SetObjectParent           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetObjectParent", libsimx))
-c_SetUIButtonLabel          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32)(("simxSetUIButtonLabel", libsimx))
-c_GetLastErrors             = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetLastErrors", libsimx))
-c_GetArrayParameter         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetArrayParameter", libsimx))
-c_SetArrayParameter         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetArrayParameter", libsimx))
-c_GetBooleanParameter       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxGetBooleanParameter", libsimx))
-c_SetBooleanParameter       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetBooleanParameter", libsimx))
-c_GetIntegerParameter       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetIntegerParameter", libsimx))
-c_SetIntegerParameter       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetIntegerParameter", libsimx))
-c_GetFloatingParameter      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetFloatingParameter", libsimx))
-c_SetFloatingParameter      = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetFloatingParameter", libsimx))
-c_GetStringParameter        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetStringParameter", libsimx))
-c_GetCollisionHandle        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetCollisionHandle", libsimx))
-c_GetDistanceHandle         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetDistanceHandle", libsimx))
-c_GetCollectionHandle       = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetCollectionHandle", libsimx))
-c_ReadCollision             = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxReadCollision", libsimx))
-c_ReadDistance              = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxReadDistance", libsimx))
-c_RemoveObject              = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveObject", libsimx))
-c_RemoveModel               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveModel", libsimx))
-c_RemoveUI                  = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveUI", libsimx))
-c_CloseScene                = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32)(("simxCloseScene", libsimx))
-c_GetObjects                = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxGetObjects", libsimx))
-c_DisplayDialog             = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.c_int32)(("simxDisplayDialog", libsimx))
-c_EndDialog                 = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxEndDialog", libsimx))
-c_GetDialogInput            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetDialogInput", libsimx))
-c_GetDialogResult           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetDialogResult", libsimx))
-c_CopyPasteObjects          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32, ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxCopyPasteObjects", libsimx))
-c_GetObjectSelection        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectSelection", libsimx))
-c_SetObjectSelection        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32, ct.c_int32)(("simxSetObjectSelection", libsimx))
-c_ClearFloatSignal          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearFloatSignal", libsimx))
-c_ClearIntegerSignal        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearIntegerSignal", libsimx))
-c_ClearStringSignal         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearStringSignal", libsimx))
-c_GetFloatSignal            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_float), ct.c_int32)(("simxGetFloatSignal", libsimx))
-c_GetIntegerSignal          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetIntegerSignal", libsimx))
-c_GetStringSignal           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetStringSignal", libsimx))
-c_SetFloatSignal            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_float, ct.c_int32)(("simxSetFloatSignal", libsimx))
-c_SetIntegerSignal          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32)(("simxSetIntegerSignal", libsimx))
-c_SetStringSignal           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxSetStringSignal", libsimx))
-c_AppendStringSignal        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxAppendStringSignal", libsimx))
-c_WriteStringStream         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxWriteStringStream", libsimx))
-c_GetObjectFloatParameter   = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectFloatParameter", libsimx))
-c_SetObjectFloatParameter   = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetObjectFloatParameter", libsimx))
-c_GetObjectIntParameter     = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectIntParameter", libsimx))
-c_SetObjectIntParameter     = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetObjectIntParameter", libsimx))
-c_GetModelProperty          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetModelProperty", libsimx))
-c_SetModelProperty          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetModelProperty", libsimx))
-c_Start                     = ct.CFUNCTYPE(ct.c_int32,ct.POINTER(ct.c_char), ct.c_int32, ct.c_ubyte, ct.c_ubyte, ct.c_int32, ct.c_int32)(("simxStart", libsimx))
-c_Finish                    = ct.CFUNCTYPE(None, ct.c_int32)(("simxFinish", libsimx))
-c_GetPingTime               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetPingTime", libsimx))
-c_GetLastCmdTime            = ct.CFUNCTYPE(ct.c_int32,ct.c_int32)(("simxGetLastCmdTime", libsimx))
-c_SynchronousTrigger        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32)(("simxSynchronousTrigger", libsimx))
-c_Synchronous               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_ubyte)(("simxSynchronous", libsimx))
-c_PauseCommunication        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_ubyte)(("simxPauseCommunication", libsimx))
-c_GetInMessageInfo          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetInMessageInfo", libsimx))
-c_GetOutMessageInfo         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetOutMessageInfo", libsimx))
-c_GetConnectionId           = ct.CFUNCTYPE(ct.c_int32,ct.c_int32)(("simxGetConnectionId", libsimx))
-c_CreateBuffer              = ct.CFUNCTYPE(ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxCreateBuffer", libsimx))
-c_ReleaseBuffer             = ct.CFUNCTYPE(None, ct.c_void_p)(("simxReleaseBuffer", libsimx))
-c_TransferFile              = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32)(("simxTransferFile", libsimx))
-c_EraseFile                 = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxEraseFile", libsimx))
-c_GetAndClearStringSignal   = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetAndClearStringSignal", libsimx))
-c_ReadStringStream          = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxReadStringStream", libsimx))
-c_CreateDummy               = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_float, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_int32), ct.c_int32)(("simxCreateDummy", libsimx))
-c_Query                     = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxQuery", libsimx))
-c_GetObjectGroupData        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetObjectGroupData", libsimx))
-c_GetObjectVelocity         = ct.CFUNCTYPE(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectVelocity", libsimx))
-c_CallScriptFunction        = ct.CFUNCTYPE(ct.c_int32,ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_int32),ct.c_int32,ct.POINTER(ct.c_float),ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_ubyte),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_ubyte)),ct.c_int32)(("simxCallScriptFunction", libsimx))
+c_GetJointPosition          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointPosition", libsimx))
+c_SetJointPosition          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointPosition", libsimx))
+c_GetJointMatrix            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointMatrix", libsimx))
+c_SetSphericalJointMatrix   = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetSphericalJointMatrix", libsimx))
+c_SetJointTargetVelocity    = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointTargetVelocity", libsimx))
+c_SetJointTargetPosition    = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointTargetPosition", libsimx))
+c_GetJointForce             = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetJointForce", libsimx))
+c_SetJointForce             = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetJointForce", libsimx))
+c_ReadForceSensor           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.c_int32)(("simxReadForceSensor", libsimx))
+c_BreakForceSensor          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxBreakForceSensor", libsimx))
+c_ReadVisionSensor          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.POINTER(ct.c_float)), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxReadVisionSensor", libsimx))
+c_GetObjectHandle           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectHandle", libsimx))
+c_GetVisionSensorImage      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_byte)), ct.c_ubyte, ct.c_int32)(("simxGetVisionSensorImage", libsimx))
+c_SetVisionSensorImage      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_byte), ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetVisionSensorImage", libsimx))
+c_GetVisionSensorDepthBuffer= _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)), ct.c_int32)(("simxGetVisionSensorDepthBuffer", libsimx))
+c_GetObjectChild            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectChild", libsimx))
+c_GetObjectParent           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectParent", libsimx))
+c_ReadProximitySensor       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_float), ct.c_int32)(("simxReadProximitySensor", libsimx))
+c_LoadModel                 = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.POINTER(ct.c_int32), ct.c_int32)(("simxLoadModel", libsimx))
+c_LoadUI                    = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxLoadUI", libsimx))
+c_LoadScene                 =  _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_ubyte, ct.c_int32)(("simxLoadScene", libsimx))
+c_StartSimulation           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32)(("simxStartSimulation", libsimx))
+c_PauseSimulation           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32)(("simxPauseSimulation", libsimx))
+c_StopSimulation            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32)(("simxStopSimulation", libsimx))
+c_GetUIHandle               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIHandle", libsimx))
+c_GetUISlider               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUISlider", libsimx))
+c_SetUISlider               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetUISlider", libsimx))
+c_GetUIEventButton          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIEventButton", libsimx))
+c_GetUIButtonProperty       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetUIButtonProperty", libsimx))
+c_SetUIButtonProperty       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetUIButtonProperty", libsimx))
+c_AddStatusbarMessage       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxAddStatusbarMessage", libsimx))
+c_AuxiliaryConsoleOpen      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.c_int32)(("simxAuxiliaryConsoleOpen", libsimx))
+c_AuxiliaryConsoleClose     = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxAuxiliaryConsoleClose", libsimx))
+c_AuxiliaryConsolePrint     = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxAuxiliaryConsolePrint", libsimx))
+c_AuxiliaryConsoleShow      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxAuxiliaryConsoleShow", libsimx))
+c_GetObjectOrientation      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectOrientation", libsimx))
+c_GetObjectPosition         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectPosition", libsimx))
+c_SetObjectOrientation      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetObjectOrientation", libsimx))
+c_SetObjectPosition         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetObjectPosition", libsimx))
+c_SetObjectParent           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetObjectParent", libsimx))
+c_SetUIButtonLabel          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32)(("simxSetUIButtonLabel", libsimx))
+c_GetLastErrors             = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetLastErrors", libsimx))
+c_GetArrayParameter         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetArrayParameter", libsimx))
+c_SetArrayParameter         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxSetArrayParameter", libsimx))
+c_GetBooleanParameter       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxGetBooleanParameter", libsimx))
+c_SetBooleanParameter       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_ubyte, ct.c_int32)(("simxSetBooleanParameter", libsimx))
+c_GetIntegerParameter       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetIntegerParameter", libsimx))
+c_SetIntegerParameter       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetIntegerParameter", libsimx))
+c_GetFloatingParameter      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetFloatingParameter", libsimx))
+c_SetFloatingParameter      = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetFloatingParameter", libsimx))
+c_GetStringParameter        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetStringParameter", libsimx))
+c_GetCollisionHandle        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetCollisionHandle", libsimx))
+c_GetDistanceHandle         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetDistanceHandle", libsimx))
+c_GetCollectionHandle       = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetCollectionHandle", libsimx))
+c_ReadCollision             = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxReadCollision", libsimx))
+c_ReadDistance              = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxReadDistance", libsimx))
+c_RemoveObject              = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveObject", libsimx))
+c_RemoveModel               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveModel", libsimx))
+c_RemoveUI                  = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxRemoveUI", libsimx))
+c_CloseScene                = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32)(("simxCloseScene", libsimx))
+c_GetObjects                = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.c_int32)(("simxGetObjects", libsimx))
+c_DisplayDialog             = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.POINTER(ct.c_int32), ct.POINTER(ct.c_int32), ct.c_int32)(("simxDisplayDialog", libsimx))
+c_EndDialog                 = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32)(("simxEndDialog", libsimx))
+c_GetDialogInput            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetDialogInput", libsimx))
+c_GetDialogResult           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetDialogResult", libsimx))
+c_CopyPasteObjects          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32, ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxCopyPasteObjects", libsimx))
+c_GetObjectSelection        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectSelection", libsimx))
+c_SetObjectSelection        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32, ct.c_int32)(("simxSetObjectSelection", libsimx))
+c_ClearFloatSignal          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearFloatSignal", libsimx))
+c_ClearIntegerSignal        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearIntegerSignal", libsimx))
+c_ClearStringSignal         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxClearStringSignal", libsimx))
+c_GetFloatSignal            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_float), ct.c_int32)(("simxGetFloatSignal", libsimx))
+c_GetIntegerSignal          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetIntegerSignal", libsimx))
+c_GetStringSignal           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetStringSignal", libsimx))
+c_SetFloatSignal            = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_float, ct.c_int32)(("simxSetFloatSignal", libsimx))
+c_SetIntegerSignal          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32)(("simxSetIntegerSignal", libsimx))
+c_SetStringSignal           = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxSetStringSignal", libsimx))
+c_AppendStringSignal        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxAppendStringSignal", libsimx))
+c_WriteStringStream         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.c_int32)(("simxWriteStringStream", libsimx))
+c_GetObjectFloatParameter   = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectFloatParameter", libsimx))
+c_SetObjectFloatParameter   = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_float, ct.c_int32)(("simxSetObjectFloatParameter", libsimx))
+c_GetObjectIntParameter     = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetObjectIntParameter", libsimx))
+c_SetObjectIntParameter     = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetObjectIntParameter", libsimx))
+c_GetModelProperty          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetModelProperty", libsimx))
+c_SetModelProperty          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.c_int32)(("simxSetModelProperty", libsimx))
+c_Start                     = _lazy_cfunctype(ct.c_int32,ct.POINTER(ct.c_char), ct.c_int32, ct.c_ubyte, ct.c_ubyte, ct.c_int32, ct.c_int32)(("simxStart", libsimx))
+c_Finish                    = _lazy_cfunctype(None, ct.c_int32)(("simxFinish", libsimx))
+c_GetPingTime               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetPingTime", libsimx))
+c_GetLastCmdTime            = _lazy_cfunctype(ct.c_int32,ct.c_int32)(("simxGetLastCmdTime", libsimx))
+c_SynchronousTrigger        = _lazy_cfunctype(ct.c_int32,ct.c_int32)(("simxSynchronousTrigger", libsimx))
+c_Synchronous               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_ubyte)(("simxSynchronous", libsimx))
+c_PauseCommunication        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_ubyte)(("simxPauseCommunication", libsimx))
+c_GetInMessageInfo          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetInMessageInfo", libsimx))
+c_GetOutMessageInfo         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32))(("simxGetOutMessageInfo", libsimx))
+c_GetConnectionId           = _lazy_cfunctype(ct.c_int32,ct.c_int32)(("simxGetConnectionId", libsimx))
+c_CreateBuffer              = _lazy_cfunctype(ct.POINTER(ct.c_ubyte), ct.c_int32)(("simxCreateBuffer", libsimx))
+c_ReleaseBuffer             = _lazy_cfunctype(None, ct.c_void_p)(("simxReleaseBuffer", libsimx))
+c_TransferFile              = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_char), ct.c_int32, ct.c_int32)(("simxTransferFile", libsimx))
+c_EraseFile                 = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.c_int32)(("simxEraseFile", libsimx))
+c_GetAndClearStringSignal   = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxGetAndClearStringSignal", libsimx))
+c_ReadStringStream          = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxReadStringStream", libsimx))
+c_CreateDummy               = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_float, ct.POINTER(ct.c_ubyte), ct.POINTER(ct.c_int32), ct.c_int32)(("simxCreateDummy", libsimx))
+c_Query                     = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.c_ubyte), ct.c_int32, ct.POINTER(ct.c_char), ct.POINTER(ct.POINTER(ct.c_ubyte)), ct.POINTER(ct.c_int32), ct.c_int32)(("simxQuery", libsimx))
+c_GetObjectGroupData        = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.c_int32, ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)), ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)), ct.c_int32)(("simxGetObjectGroupData", libsimx))
+c_GetObjectVelocity         = _lazy_cfunctype(ct.c_int32,ct.c_int32, ct.c_int32, ct.POINTER(ct.c_float), ct.POINTER(ct.c_float), ct.c_int32)(("simxGetObjectVelocity", libsimx))
+c_CallScriptFunction        = _lazy_cfunctype(ct.c_int32,ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_int32),ct.c_int32,ct.POINTER(ct.c_float),ct.c_int32,ct.POINTER(ct.c_char),ct.c_int32,ct.POINTER(ct.c_ubyte),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_int32)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_float)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_char)),ct.POINTER(ct.c_int32), ct.POINTER(ct.POINTER(ct.c_ubyte)),ct.c_int32)(("simxCallScriptFunction", libsimx))
 
 #API functions
 def simxGetJointPosition(clientID, jointHandle, operationMode):
@@ -308,6 +336,33 @@ def simxGetVisionSensorImage(clientID, sensorHandle, options, operationMode):
             reso.append(resolution[i])
     return ret, reso, image
 
+def simxGetVisionSensorImageArray(clientID, sensorHandle, options, operationMode, dtype = None):
+    '''
+    Same as simxGetVisionSensorImage, but the image is returned as a numpy array of shape (height, width, 3),
+    or (height, width) if bit 0 of options is set (grayscale). The C buffer is copied with a single memcpy.
+    dtype can be np.uint8 (default) or np.int8 to get the same signed values as simxGetVisionSensorImage
+    '''
+    import numpy as np
+
+    if dtype is None:
+        dtype = np.uint8
+
+    resolution = (ct.c_int*2)()
+    c_image  = ct.POINTER(ct.c_byte)()
+    bytesPerPixel = 3
+    if (options & 1) != 0:
+        bytesPerPixel = 1
+    ret = c_GetVisionSensorImage(clientID, sensorHandle, resolution, ct.byref(c_image), options, operationMode)
+
+    reso = []
+    image = np.empty((0,), dtype=dtype)
+    if (ret == 0):
+        reso = [resolution[0], resolution[1]]
+        shape = (resolution[1], resolution[0]) if bytesPerPixel == 1 else (resolution[1], resolution[0], bytesPerPixel)
+        image = np.empty(shape, dtype=dtype)
+        ct.memmove(image.ctypes.data, c_image, image.nbytes)
+    return ret, reso, image
+
 def simxSetVisionSensorImage(clientID, sensorHandle, image, options, operationMode):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
@@ -333,6 +388,23 @@ def simxGetVisionSensorDepthBuffer(clientID, sensorHandle, operationMode):
             reso.append(resolution[i])
     return ret, reso, buffer
 
+def simxGetVisionSensorDepthBufferArray(clientID, sensorHandle, operationMode):
+    '''
+    Same as simxGetVisionSensorDepthBuffer, but the depth buffer is returned as a float32 numpy array
+    of shape (height, width). The C buffer is copied with a single memcpy.
+    '''
+    import numpy as np
+    c_buffer  = ct.POINTER(ct.c_float)()
+    resolution = (ct.c_int*2)()
+    ret = c_GetVisionSensorDepthBuffer(clientID, sensorHandle, resolution, ct.byref(c_buffer), operationMode)
+    reso = []
+    buffer = np.empty((0,), dtype=np.float32)
+    if (ret == 0):
+        reso = [resolution[0], resolution[1]]
+        buffer = np.empty((resolution[1], resolution[0]), dtype=np.float32)
+        ct.memmove(buffer.ctypes.data, c_buffer, buffer.nbytes)
+    return ret, reso, buffer
+
 def simxGetObjectChild(clientID, parentObjectHandle, childIndex, operationMode):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
@@ -1292,6 +1364,30 @@ def simxQuery(clientID, signalName, signalValue, retSignalName, timeOutInMs):
 
     return ret, a
 
+def _copy_to_array(pointer, count, dtype):
+    '''
+    Copies count items of the C buffer pointed by pointer into a new numpy array of type dtype with a single memcpy
+    '''
+    import numpy as np
+    arr = np.empty((count,), dtype=dtype)
+    if count > 0:
+        ct.memmove(arr.ctypes.data, pointer, arr.nbytes)
+    return arr
+
+def _split_strings(pointer, count):
+    '''
+    Splits count null-terminated strings stored consecutively in the C buffer pointed by pointer
+    '''
+    strings = []
+    address = ct.cast(pointer, ct.c_void_p).value
+    for i in range(count):
+        a = ct.string_at(address)
+        address += len(a) + 1
+        if sys.version_info[0] == 3:
+            a=str(a,'utf-8')
+        strings.append(a)
+    return strings
+
 def simxGetObjectGroupData(clientID, objectType, dataType, operationMode):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
@@ -1312,72 +1408,102 @@ def simxGetObjectGroupData(clientID, objectType, dataType, operationMode):
     ret = c_GetObjectGroupData(clientID, objectType, dataType, ct.byref(handlesC), ct.byref(handlesP), ct.byref(intDataC), ct.byref(intDataP), ct.byref(floatDataC), ct.byref(floatDataP), ct.byref(stringDataC), ct.byref(stringDataP), operationMode)
     
     if ret == 0:
-        for i in range(handlesC.value):
-            handles.append(handlesP[i])
-        for i in range(intDataC.value):
-            intData.append(intDataP[i])
-        for i in range(floatDataC.value):
-            floatData.append(floatDataP[i])
-        s = 0
-        for i in range(stringDataC.value):
-            a = bytearray()
-            while stringDataP[s] != b'\0':
-                if sys.version_info[0] == 3:
-                    a.append(int.from_bytes(stringDataP[s],'big'))
-                else:
-                    a.append(stringDataP[s])
-                s += 1
-            s += 1 #skip null
-            if sys.version_info[0] == 3:
-                a=str(a,'utf-8')
-            else:
-                a=str(a)
-            stringData.append(a)
+        handles = handlesP[:handlesC.value]
+        intData = intDataP[:intDataC.value]
+        floatData = floatDataP[:floatDataC.value]
+        stringData = _split_strings(stringDataP, stringDataC.value)
  
     return ret, handles, intData, floatData, stringData
 
-def simxCallScriptFunction(clientID, scriptDescription, options, functionName, inputInts, inputFloats, inputStrings, inputBuffer, operationMode):
+def simxGetObjectGroupDataArrays(clientID, objectType, dataType, operationMode):
     '''
-    Please have a look at the function description/documentation in the V-REP user manual
+    Same as simxGetObjectGroupData, but handles and integer data are returned as int32 numpy arrays and
+    float data as a float32 numpy array. Each C buffer is copied with a single memcpy.
     '''
+    import numpy as np
+
+    handlesC = ct.c_int()
+    handlesP = ct.POINTER(ct.c_int)()
+    intDataC = ct.c_int()
+    intDataP = ct.POINTER(ct.c_int)()
+    floatDataC = ct.c_int()
+    floatDataP = ct.POINTER(ct.c_float)()
+    stringDataC = ct.c_int()
+    stringDataP = ct.POINTER(ct.c_char)()
+    ret = c_GetObjectGroupData(clientID, objectType, dataType, ct.byref(handlesC), ct.byref(handlesP), ct.byref(intDataC), ct.byref(intDataP), ct.byref(floatDataC), ct.byref(floatDataP), ct.byref(stringDataC), ct.byref(stringDataP), operationMode)
 
-    inputBufferV=inputBuffer
+    if ret == 0:
+        handles = _copy_to_array(handlesP, handlesC.value, np.int32)
+        intData = _copy_to_array(intDataP, intDataC.value, np.int32)
+        floatData = _copy_to_array(floatDataP, floatDataC.value, np.float32)
+        stringData = _split_strings(stringDataP, stringDataC.value)
+    else:
+        handles = np.empty((0,), dtype=np.int32)
+        intData = np.empty((0,), dtype=np.int32)
+        floatData = np.empty((0,), dtype=np.float32)
+        stringData = []
+
+    return ret, handles, intData, floatData, stringData
+
+def _as_array(values, dtype):
+    '''
+    Converts values into a contiguous numpy array of type dtype. values can be a list, a numpy array or any object
+    that implements the buffer protocol (bytes, bytearray, memoryview, array.array), in which case its contents are
+    reinterpreted as items of type dtype without being copied
+    '''
+    import numpy as np
+    if isinstance(values, np.ndarray):
+        return np.ascontiguousarray(values, dtype=dtype)
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        return np.frombuffer(values, dtype=dtype)
+    return np.asarray(values, dtype=dtype)
+
+def _as_c_array(values, ctype, dtype):
+    '''
+    Converts values into a contiguous array of ctype items. Numpy arrays are converted with _as_array, objects that
+    implement the buffer protocol (bytes, bytearray, memoryview) are reinterpreted as items of type ctype and any other
+    sequence is converted item by item, so numpy is only imported if values is a numpy array.
+    Returns a tuple (number of items, pointer to the first item, object that owns the memory)
+    '''
+    np = sys.modules.get('numpy')
+    if not np is None and isinstance(values, np.ndarray):
+        arr = _as_array(values, dtype).reshape(-1)
+        return len(arr), arr.ctypes.data_as(ct.POINTER(ctype)), arr
+    if isinstance(values, (bytes, bytearray, memoryview)):
+        data = memoryview(values).cast('B')
+        count = len(data) // ct.sizeof(ctype)
+        arr = (ctype * count).from_buffer_copy(data[:count * ct.sizeof(ctype)])
+    else:
+        arr = (ctype * len(values))(*values)
+    return len(arr), ct.cast(arr, ct.POINTER(ctype)), arr
+
+def simxCallScriptFunction(clientID, scriptDescription, options, functionName, inputInts, inputFloats, inputStrings, inputBuffer, operationMode, returnArrays=False):
+    '''
+    Please have a look at the function description/documentation in the V-REP user manual
+
+    inputInts and inputFloats can also be numpy arrays or packed bytes (int32 / float32), and inputBuffer any object
+    implementing the buffer protocol. If returnArrays is True, output ints and floats are returned as int32 / float32
+    numpy arrays instead of lists. numpy is only imported if some of the inputs is a numpy array or returnArrays is True.
+    '''
     if sys.version_info[0] == 3:
         if type(scriptDescription) is str:
             scriptDescription=scriptDescription.encode('utf-8')
         if type(functionName) is str:
             functionName=functionName.encode('utf-8')
-        if type(inputBuffer) is bytearray:
-            inputBufferV  = (ct.c_ubyte*len(inputBuffer))(*inputBuffer)
-        if type(inputBuffer) is str:
-            inputBuffer=inputBuffer.encode('utf-8')
-            inputBufferV  = (ct.c_ubyte*len(inputBuffer))(*inputBuffer)
-    else:
-        if type(inputBuffer) is bytearray:
-            inputBufferV = (ct.c_ubyte*len(inputBuffer))(*inputBuffer)
-        if type(inputBuffer) is str:
-            inputBuffer=bytearray(inputBuffer)
-            inputBufferV = (ct.c_ubyte*len(inputBuffer))(*inputBuffer)
-    inputBufferV=ct.cast(inputBufferV,ct.POINTER(ct.c_ubyte)) # IronPython needs this
-
-    c_inInts  = (ct.c_int*len(inputInts))(*inputInts)
-    c_inInts = ct.cast(c_inInts,ct.POINTER(ct.c_int)) # IronPython needs this
-    c_inFloats  = (ct.c_float*len(inputFloats))(*inputFloats)
-    c_inFloats = ct.cast(c_inFloats,ct.POINTER(ct.c_float)) # IronPython needs this
-
-    concatStr=''.encode('utf-8')
-    for i in range(len(inputStrings)):
-        a=inputStrings[i]
-        a=a+'\0'
-        if type(a) is str:
-            a=a.encode('utf-8')
-        concatStr=concatStr+a
-    c_inStrings  = (ct.c_char*len(concatStr))(*concatStr)
-
-    intDataOut =[]
-    floatDataOut =[]
-    stringDataOut =[]
-    bufferOut =bytearray()
+    if type(inputBuffer) is str:
+        inputBuffer=inputBuffer.encode('utf-8')
+    np = sys.modules.get('numpy')
+    if not np is None and isinstance(inputBuffer, np.ndarray):
+        inputBuffer = np.ascontiguousarray(inputBuffer).view(np.uint8)
+    elif not isinstance(inputBuffer, (bytes, bytearray, memoryview)):
+        inputBuffer = bytearray(inputBuffer)
+    inputBufferC, inputBufferV, inputBuffer = _as_c_array(inputBuffer, ct.c_ubyte, 'uint8')
+
+    inputIntsC, c_inInts, inputInts = _as_c_array(inputInts, ct.c_int, 'int32')
+    inputFloatsC, c_inFloats, inputFloats = _as_c_array(inputFloats, ct.c_float, 'float32')
+
+    concatStr = b''.join([(a.encode('utf-8') if type(a) is str else bytes(a)) + b'\0' for a in inputStrings])
+    c_inStrings = ct.c_char_p(concatStr)
 
     intDataC = ct.c_int()
     intDataP = ct.POINTER(ct.c_int)()
@@ -1388,30 +1514,25 @@ def simxCallScriptFunction(clientID, scriptDescription, options, functionName, i
     bufferS = ct.c_int()
     bufferP = ct.POINTER(ct.c_ubyte)()
 
-    ret = c_CallScriptFunction(clientID,scriptDescription,options,functionName,len(inputInts),c_inInts,len(inputFloats),c_inFloats,len(inputStrings),c_inStrings,len(inputBuffer),inputBufferV,ct.byref(intDataC),ct.byref(intDataP),ct.byref(floatDataC),ct.byref(floatDataP),ct.byref(stringDataC),ct.byref(stringDataP),ct.byref(bufferS),ct.byref(bufferP),operationMode)
+    ret = c_CallScriptFunction(clientID,scriptDescription,options,functionName,inputIntsC,c_inInts,inputFloatsC,c_inFloats,len(inputStrings),ct.cast(c_inStrings,ct.POINTER(ct.c_char)),inputBufferC,inputBufferV,ct.byref(intDataC),ct.byref(intDataP),ct.byref(floatDataC),ct.byref(floatDataP),ct.byref(stringDataC),ct.byref(stringDataP),ct.byref(bufferS),ct.byref(bufferP),operationMode)
+
+    if returnArrays:
+        import numpy as np
 
     if ret == 0:
-        for i in range(intDataC.value):
-            intDataOut.append(intDataP[i])
-        for i in range(floatDataC.value):
-            floatDataOut.append(floatDataP[i])
-        s = 0
-        for i in range(stringDataC.value):
-            a = bytearray()
-            while stringDataP[s] != b'\0':
-                if sys.version_info[0] == 3:
-                    a.append(int.from_bytes(stringDataP[s],'big'))
-                else:
-                    a.append(stringDataP[s])
-                s += 1
-            s += 1 #skip null
-            if sys.version_info[0] == 3:
-                a=str(a,'utf-8')
-            else:
-                a=str(a)
-            stringDataOut.append(a)
-        for i in range(bufferS.value):
-            bufferOut.append(bufferP[i])
+        if returnArrays:
+            intDataOut = _copy_to_array(intDataP, intDataC.value, np.int32)
+            floatDataOut = _copy_to_array(floatDataP, floatDataC.value, np.float32)
+        else:
+            intDataOut = intDataP[:intDataC.value]
+            floatDataOut = floatDataP[:floatDataC.value]
+        stringDataOut = _split_strings(stringDataP, stringDataC.value)
+        bufferOut = bytearray(ct.string_at(bufferP, bufferS.value)) if bufferS.value > 0 else bytearray()
+    else:
+        intDataOut = np.empty((0,), dtype=np.int32) if returnArrays else []
+        floatDataOut = np.empty((0,), dtype=np.float32) if returnArrays else []
+        stringDataOut = []
+        bufferOut = bytearray()
     if sys.version_info[0] != 3:
         bufferOut=str(bufferOut)
 
@@ -1435,49 +1556,53 @@ def simxGetObjectVelocity(clientID, objectHandle, operationMode):
 def simxPackInts(intList):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
+
+    intList can be a list, an array.array or a numpy array.
     '''
+    import numpy as np
     
+    s = np.asarray(intList, dtype='<i4').tobytes()
     if sys.version_info[0] == 3:
-        s=bytes()
-        for i in range(len(intList)):
-            s=s+struct.pack('<i',intList[i])
         s=bytearray(s)
-    else:
-        s=''
-        for i in range(len(intList)):
-            s+=struct.pack('<i',intList[i])
     return s
 
 def simxUnpackInts(intsPackedInString):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
     '''
-    b=[]
-    for i in range(int(len(intsPackedInString)/4)):
-        b.append(struct.unpack('<i',intsPackedInString[4*i:4*(i+1)])[0])
-    return b
+    return simxUnpackIntsArray(intsPackedInString).tolist()
+
+def simxUnpackIntsArray(intsPackedInString):
+    '''
+    Same as simxUnpackInts, but returns an int32 numpy array that shares memory with intsPackedInString
+    '''
+    import numpy as np
+    n = len(intsPackedInString) // 4
+    return np.frombuffer(intsPackedInString, dtype='<i4', count=n)
 
 def simxPackFloats(floatList):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
+
+    floatList can be a list, an array.array or a numpy array.
     '''
+    import numpy as np
 
+    s = np.asarray(floatList, dtype='<f4').tobytes()
     if sys.version_info[0] == 3:
-        s=bytes()
-        for i in range(len(floatList)):
-            s=s+struct.pack('<f',floatList[i])
         s=bytearray(s)
-    else:
-        s=''
-        for i in range(len(floatList)):
-            s+=struct.pack('<f',floatList[i])
     return s
 
 def simxUnpackFloats(floatsPackedInString):
     '''
     Please have a look at the function description/documentation in the V-REP user manual
     '''
-    b=[]
-    for i in range(int(len(floatsPackedInString)/4)):
-        b.append(struct.unpack('<f',floatsPackedInString[4*i:4*(i+1)])[0])
-    return b
+    return simxUnpackFloatsArray(floatsPackedInString).tolist()
+
+def simxUnpackFloatsArray(floatsPackedInString):
+    '''
+    Same as simxUnpackFloats, but returns a float32 numpy array that shares memory with floatsPackedInString
+    '''
+    import numpy as np
+    n = len(floatsPackedInString) // 4
+    return np.frombuffer(floatsPackedInString, dtype='<f4', count=n)
@@ -69,5 +69,8 @@ class RemoteMethodError(Exception):
     '''
     Error lanzado al ejecutar un procedimiento remoto de V-rep
     '''
-    def __init__(self, method_name):
-        super().__init__('Failed to execute remote V-rep method named "{}"', method_name)
\ No newline at end of file
+    def __init__(self, method_name, reason = None):
+        if reason is None:
+            super().__init__('Failed to execute remote V-rep method named "{}"', method_name)
+        else:
+            super().__init__('Failed to execute remote V-rep method named "{}": {}', method_name, reason)
\ No newline at end of file
@@ -1,15 +1,32 @@
 
 import vrep_binds as binds
-import numpy as np
-from PIL import Image
-from vectormath import Vector3
 from vrep_errors import Exception
+from time import monotonic, sleep
+
+
+# Tipos de datos que pueden consultarse con simxGetObjectGroupData
+group_data_object_name = 0
+group_data_absolute_position = 3
+group_data_absolute_orientation = 5
+group_data_absolute_pose = 9
+group_data_proximity_sensor = 13
+group_data_joint_state = 15
+
+# Parámetro de las uniones (simxGetObjectFloatParameter) con su velocidad actual (sim_jointfloatparam_velocity)
+joint_float_parameter_velocity = 2012
+
+# Valor de la señal de progreso de una trayectoria cancelada (ver Trajectory)
+trajectory_cancelled = -1
 
 class Object:
     '''
     Representa un objeto de la escena. Esta clase no se instancia directamente. Las subclases de esta
     definen distintos tipos de objetos de la escena V-rep.
+    Las instancias no tienen __dict__ (se usa __slots__) para reducir la memoria en escenas con muchos objetos;
+    las subclases deben declarar en __slots__ sus atributos.
     '''
+    __slots__ = ('client', 'id')
+
     def __init__(self, client, id):
         self.client = client
         self.id = id
@@ -23,46 +40,305 @@ class Object:
 
 
 
-class Joint(Object):
+class DataStream:
+    '''
+    Clase base para las clases que obtienen datos del simulador V-rep mediante streams entre cliente y servidor.
+    Las subclases deben definir el atributo client.
+    '''
+    __slots__ = ()
+
+    # Pares (atributo que indica si el stream está iniciado, atributo con la primera medición) de cada stream
+    stream_attrs = (('streamed', 'initial_value'),)
+
+    def rearm_streams(self):
+        '''
+        Marca todos los streams como no iniciados: la siguiente lectura de cada uno se hace con una petición
+        bloqueante y el stream se vuelve a iniciar. Se usa cuando cambia la escena del simulador.
+        '''
+        for streamed_attr, initial_value_attr in self.stream_attrs:
+            setattr(self, streamed_attr, False)
+            setattr(self, initial_value_attr, None)
+
+    def _get_stream_value(self, get_data, start_streaming, streamed_attr = 'streamed', initial_value_attr = 'initial_value',
+                          require_running = True, command = None, new_only = False):
+        '''
+        Devuelve la medición actual de uno de los flujos de datos. La primera lectura se hace
+        con una petición bloqueante al servidor y después se inicia el stream; las siguientes se obtienen
+        del buffer del cliente.
+        :param get_data: Método que obtiene la medición (igual que _get_data)
+        :param start_streaming: Método que inicia el stream (igual que start_streaming)
+        :param streamed_attr: Nombre del atributo que indica si el stream está iniciado.
+        :param initial_value_attr: Nombre del atributo donde se guarda la primera medición, que se devuelve
+        mientras el buffer del cliente aún no tenga datos.
+        :param require_running: Si es True (por defecto), se genera una excepción si la simulación no está
+        en ejecución.
+        :param command: Función que recibe un modo de operación y envía el comando del stream con ese modo (el
+        mismo comando que start_streaming). Si se indica, el stream se registra en el cliente (ver StreamRegistry)
+        para poder detenerlo.
+        :param new_only: Si es True, devuelve None si la medición es la misma que se devolvió en la lectura
+        anterior. Cada medición tiene la marca de tiempo del servidor en la que se obtuvo (simxGetLastCmdTime,
+        el tiempo de simulación en milisegundos); solo se puede detectar si es nueva si se indica command.
+        '''
+        self.client.check_scene()
+        simulation = self.client.simulation
+
+        if require_running and not simulation.is_running():
+            raise Exception('Error getting sensor data: V-rep simulation is not running')
+
+        # Marca de tiempo de la medición (None si no se ha recibido una nueva medición)
+        sample_time = None
+
+        if not getattr(self, streamed_attr):
+            data = get_data(streamed=False)
+            sample_time = binds.simxGetLastCmdTime(self.client.get_id())
+            start_streaming()
+            if not command is None:
+                self.client.streams.register(self, streamed_attr, initial_value_attr, command)
+            setattr(self, initial_value_attr, data)
+            value = data
+        else:
+            try:
+                data = get_data(streamed=True)
+                sample_time = binds.simxGetLastCmdTime(self.client.get_id())
+                value = data
+                if not getattr(self, initial_value_attr) is None:
+                    setattr(self, initial_value_attr, None)
+            except Exception as exc:
+                initial_value = getattr(self, initial_value_attr)
+                if initial_value is None:
+                    raise exc
+                value = initial_value
+
+        is_new = self.client.streams.touch(self, streamed_attr, value, sample_time)
+        if new_only and not is_new:
+            return None
+        return value
+
+    def _wait_new_stream_value(self, get_value, timeout = None, poll_interval = 0.001):
+        '''
+        Espera a que haya una nueva medición en uno de los flujos de datos y la devuelve.
+        :param get_value: Método que devuelve la medición, con el parámetro new_only (p.ej Sensor.get_value)
+        :param timeout: Es el tiempo máximo de espera (en segundos). Por defecto None (sin límite)
+        :param poll_interval: Es el tiempo (en segundos) entre consultas al buffer del cliente.
+        :return: Devuelve la nueva medición, o None si se ha agotado el tiempo de espera.
+        '''
+        start = monotonic()
+        while True:
+            value = get_value(new_only = True)
+            if not value is None:
+                return value
+            if not timeout is None and monotonic() - start >= timeout:
+                return None
+            sleep(poll_interval)
+
+    def _get_sample_time(self, streamed_attr = 'streamed'):
+        '''
+        Devuelve la marca de tiempo de la última medición de uno de los flujos de datos (el tiempo de simulación
+        en milisegundos en el que el servidor la obtuvo), o None si el stream no está iniciado.
+        '''
+        return self.client.streams.get_sample_time(self, streamed_attr)
+
+
+
+class Joint(Object, DataStream):
     '''
     Representa un objeto del tipo 'Joint' (una unión entre varios objetos) que puede ser pasivo o
     activo (actua como un motor)
+
+    Las velocidades establecidas se agrupan: solo se envía un comando al servidor si la velocidad es distinta
+    (con la tolerancia client.velocity_tolerance) a la última enviada y, si client.velocity_rate_limit no es None,
+    como mucho velocity_rate_limit comandos por segundo (salvo la velocidad 0, que siempre se envía). Las
+    velocidades descartadas por el límite quedan pendientes y se envían en la siguiente llamada permitida, al
+    terminar cada ciclo de control (ver StreamRegistry.tick, que se invoca en cada Simulation.step()) o con
+    flush_velocity(). La última velocidad enviada a cada unión se guarda en el cliente (client.joint_velocities),
+    de forma que se comparte con las velocidades establecidas con Swarm.write_velocities. Los contadores
+    sent_commands y suppressed_commands indican cuántos comandos se han enviado y descartado (también hay
+    contadores para todas las uniones en el cliente)
+
+    La posición, la velocidad y la fuerza (o par) de la unión se obtienen mediante streams, igual que las
+    mediciones de los sensores: la primera lectura es una petición bloqueante y las siguientes se obtienen del
+    buffer del cliente.
     '''
-    def _set_velocity(self, amount):
+    __slots__ = ('pending_velocity', 'sent_commands', 'suppressed_commands',
+                 'position_streamed', 'initial_position', 'velocity_streamed', 'initial_velocity',
+                 'force_streamed', 'initial_force')
+    stream_attrs = (('position_streamed', 'initial_position'), ('velocity_streamed', 'initial_velocity'),
+                    ('force_streamed', 'initial_force'))
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pending_velocity = None
+        self.sent_commands = 0
+        self.suppressed_commands = 0
+        self.rearm_streams()
+
+    def _set_velocity(self, amount, force = False):
         '''
         Establece la velocidad del motor.
         :param amount: Es la velocidad del motor, en metros/segundo o en radianes/segundo en función del
         tipo de unión.
+        :param force: Si es True, el comando se envía aunque la velocidad no haya cambiado.
         :return:
         '''
-        code = binds.simxSetJointTargetVelocity(self.client.get_id(), self.get_id(), amount, binds.simx_opmode_oneshot)
+        client = self.client
+        handle = self.get_id()
+        now = monotonic()
+
+        # La velocidad se compara con la última enviada (no con la pendiente). La última velocidad enviada deja de
+        # ser válida si se ha parado la simulación o ha cambiado la escena
+        last = client.joint_velocities.get(handle)
+        if not force and not last is None and last[2] == client.velocity_epoch:
+            last_velocity, last_velocity_time, epoch = last
+            unchanged = abs(amount - last_velocity) <= client.velocity_tolerance
+            # Las órdenes de parada (velocidad 0) no se retienen por el límite de comandos por segundo
+            too_soon = not client.velocity_rate_limit is None and amount != 0 and now - last_velocity_time < 1 / client.velocity_rate_limit
+            if unchanged or too_soon:
+                if unchanged:
+                    self.pending_velocity = None
+                    client.pending_velocities.pop(handle, None)
+                else:
+                    self.pending_velocity = amount
+                    client.pending_velocities[handle] = self
+                self.suppressed_commands += 1
+                client.velocity_commands_suppressed += 1
+                return
+
+        code = binds.simxSetJointTargetVelocity(client.get_id(), handle, amount, binds.simx_opmode_oneshot)
         if not code in [0, 1]:
             raise Exception('Failed to set velocity to V-rep joint object')
 
-    def _set_linear_velocity(self, amount):
+        client.joint_velocities[handle] = (amount, now, client.velocity_epoch)
+        self.pending_velocity = None
+        client.pending_velocities.pop(handle, None)
+        self.sent_commands += 1
+        client.velocity_commands_sent += 1
+
+    @property
+    def last_velocity(self):
+        '''
+        Devuelve la última velocidad enviada al servidor (None si no se ha enviado ninguna o ha dejado de ser
+        válida)
+        '''
+        last = self.client.joint_velocities.get(self.get_id())
+        if last is None or last[2] != self.client.velocity_epoch:
+            return None
+        return last[0]
+
+    def _set_linear_velocity(self, amount, force = False):
         '''
         Establece la velocidad lineal actual (en metros/segundo)
         :param amount:
         :return:
         '''
-        self._set_velocity(amount)
+        self._set_velocity(amount, force)
 
-    def _set_angular_velocity(self, amount):
+    def _set_angular_velocity(self, amount, force = False):
         '''
         Establece la velocidad angular actual (en radianes / segundo)
         :param amount:
         :return:
         '''
-        self._set_velocity(amount)
+        self._set_velocity(amount, force)
 
 
-    def set_velocity(self, amount):
+    def set_velocity(self, amount, force = False):
         raise NotImplementedError()
 
+    def flush_velocity(self):
+        '''
+        Envía la última velocidad establecida si fue descartada por el límite de comandos por segundo.
+        '''
+        if not self.pending_velocity is None:
+            self._set_velocity(self.pending_velocity, force = True)
+
+    def resend_velocity(self):
+        '''
+        Vuelve a enviar la última velocidad establecida (aunque no haya cambiado)
+        '''
+        amount = self.pending_velocity if not self.pending_velocity is None else self.last_velocity
+        if not amount is None:
+            self._set_velocity(amount, force = True)
+
+
+    def _read_position(self, opmode):
+        return binds.simxGetJointPosition(self.client.get_id(), self.get_id(), opmode)
+
+    def _read_velocity(self, opmode):
+        return binds.simxGetObjectFloatParameter(self.client.get_id(), self.get_id(), joint_float_parameter_velocity, opmode)
+
+    def _read_force(self, opmode):
+        return binds.simxGetJointForce(self.client.get_id(), self.get_id(), opmode)
+
+    def _start_streaming(self, read, streamed_attr):
+        setattr(self, streamed_attr, True)
+
+        try:
+            code = read(binds.simx_opmode_streaming)[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing joint data stream on V-rep remote API server')
+
+    def _get_data(self, read, streamed):
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+        code, value = read(opmode)
+        if code != 0:
+            raise Exception('Error getting joint data from client buffer')
+        return value
+
+    def _get_joint_value(self, read, streamed_attr, initial_value_attr):
+        return self._get_stream_value(lambda streamed: self._get_data(read, streamed),
+                                      lambda: self._start_streaming(read, streamed_attr),
+                                      streamed_attr, initial_value_attr, require_running = False, command = read)
+
+    def get_position(self):
+        '''
+        Devuelve la posición actual de la unión (en metros o radianes en función del tipo de unión)
+        '''
+        return self._get_joint_value(self._read_position, 'position_streamed', 'initial_position')
+
+    def get_velocity(self):
+        '''
+        Devuelve la velocidad actual de la unión (en metros/segundo o radianes/segundo en función del tipo de unión)
+        '''
+        return self._get_joint_value(self._read_velocity, 'velocity_streamed', 'initial_velocity')
+
+    def get_force(self):
+        '''
+        Devuelve la fuerza (o el par) que ejerce actualmente la unión (en newtons o newtons·metro). Solo está
+        disponible si la unión es dinámica y la simulación está en ejecución.
+        '''
+        return self._get_joint_value(self._read_force, 'force_streamed', 'initial_force')
+
+
+    def follow_trajectory(self, times, positions):
+        '''
+        Envía al simulador una trayectoria que la unión sigue por sí sola: en cada paso de simulación, el script
+        lua (ver update_trajectories en remote_methods.lua) establece la posición objetivo de la unión
+        interpolando linealmente la trayectoria. La trayectoria se envía en una única llamada. La unión debe estar
+        en modo de control de posición.
+        e.g:
+        trajectory = joint.follow_trajectory([0, 1, 2], [0, pi / 2, 0])
+        trajectory.wait()
+        :param times: Son los instantes de tiempo de la trayectoria (en segundos desde que se recibe en el
+        simulador, en orden creciente)
+        :param positions: Son las posiciones de la unión en cada instante.
+        :return: Devuelve una instancia de Trajectory, para consultar el progreso de la trayectoria.
+        '''
+        import numpy as np
+        return Trajectory.upload(self.client, [self.get_id()], times, np.asarray(positions).reshape(-1, 1))
+
+    @property
+    def position(self):
+        return self.get_position()
+
+    @property
+    def force(self):
+        return self.get_force()
 
     @property
     def velocity(self):
-        raise NotImplementedError()
+        return self.get_velocity()
 
     @velocity.setter
     def velocity(self, amount):
@@ -71,51 +347,191 @@ class Joint(Object):
     speed = velocity
 
 
+class Trajectory(DataStream):
+    '''
+    Representa una trayectoria que siguen una o varias uniones en el simulador (ver Joint.follow_trajectory).
+    El progreso de la trayectoria se obtiene de una señal que el script lua actualiza en cada paso de simulación;
+    solo la primera consulta es una petición bloqueante (se usa un stream). Si la trayectoria se cancela o la
+    reemplaza otra trayectoria de las mismas uniones, la señal toma el valor trajectory_cancelled.
+    '''
+    def __init__(self, client, id, duration):
+        '''
+        Inicializa la instancia.
+        :param client: Es una instancia de la clase Client.
+        :param id: Es el identificador de la trayectoria en el script lua.
+        :param duration: Es la duración de la trayectoria (en segundos)
+        '''
+        self.client = client
+        self.id = id
+        self.duration = duration
+        self.signal_name = 'pyvrepclient_trajectory_{}'.format(id)
+        self.streamed = False
+        self.initial_value = None
+        self.done = False
+        self.cancelled = False
+
+    @staticmethod
+    def upload(client, handles, times, positions):
+        '''
+        Envía una trayectoria al simulador con una única llamada a un procedimiento remoto.
+        :param handles: Son los identificadores de las uniones.
+        :param times: Son los instantes de tiempo de la trayectoria (T valores en orden creciente)
+        :param positions: Es un array (T, número de uniones) con las posiciones de las uniones en cada instante.
+        :return: Devuelve una instancia de Trajectory
+        '''
+        import numpy as np
+
+        times = np.asarray(times, dtype=np.float32).ravel()
+        positions = np.asarray(positions, dtype=np.float32)
+        if len(times) == 0 or positions.shape != (len(times), len(handles)):
+            raise Exception('Invalid trajectory: Expected an array of positions of shape ({}, {})'.format(len(times), len(handles)))
+        if np.any(np.diff(times) < 0):
+            raise Exception('Invalid trajectory: Times must be in increasing order')
+
+        id = client.sync_remote_methods.follow_trajectory(np.asarray(handles, dtype=np.int32), times, positions.ravel())
+        return Trajectory(client, id, float(times[-1]))
+
+    def _stream_command(self, opmode):
+        return binds.simxGetFloatSignal(self.client.get_id(), self.signal_name, opmode)
+
+    def start_streaming(self):
+        self.streamed = True
+
+        try:
+            code = self._stream_command(binds.simx_opmode_streaming)[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing trajectory progress stream on V-rep remote API server')
+
+    def _get_data(self, streamed):
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+        code, progress = binds.simxGetFloatSignal(self.client.get_id(), self.signal_name, opmode)
+        if code != 0:
+            raise Exception('Error getting trajectory progress from client buffer')
+        return progress
+
+    def _finish(self):
+        self.done = True
+        self.client.streams.stop(self)
+        binds.simxClearFloatSignal(self.client.get_id(), self.signal_name, binds.simx_opmode_oneshot)
+
+    def get_progress(self):
+        '''
+        Devuelve el progreso de la trayectoria: un valor entre 0 (no ha empezado) y 1 (ha terminado o se ha
+        cancelado)
+        '''
+        if self.done:
+            return 1.0
+        progress = self._get_stream_value(self._get_data, self.start_streaming, require_running = False,
+                                          command = self._stream_command)
+        if progress == trajectory_cancelled:
+            self.cancelled = True
+            self._finish()
+            return 1.0
+        if progress >= 1:
+            self._finish()
+        return progress
+
+    def is_done(self):
+        '''
+        Comprueba si la trayectoria ha terminado (o se ha cancelado)
+        '''
+        return self.get_progress() >= 1
+
+    def is_cancelled(self):
+        '''
+        Comprueba si la trayectoria se ha cancelado (con cancel() o porque la ha reemplazado otra trayectoria de
+        las mismas uniones)
+        '''
+        self.get_progress()
+        return self.cancelled
+
+    def wait(self, timeout = None, poll_interval = 0.01):
+        '''
+        Espera a que termine la trayectoria. La simulación debe estar en ejecución.
+        :param timeout: Es el tiempo máximo de espera (en segundos). Por defecto None (sin límite)
+        :param poll_interval: Es el tiempo (en segundos) entre consultas al buffer del cliente.
+        :return: Devuelve True si la trayectoria ha terminado, False si se ha agotado el tiempo de espera.
+        '''
+        start = monotonic()
+        while not self.is_done():
+            if not timeout is None and monotonic() - start >= timeout:
+                return False
+            sleep(poll_interval)
+        return True
+
+    def cancel(self):
+        '''
+        Cancela la trayectoria. Las uniones se quedan en su posición objetivo actual.
+        '''
+        if not self.done:
+            self.client.sync_remote_methods.stop_trajectory(self.id)
+            self.cancelled = True
+            self._finish()
+
+    @property
+    def progress(self):
+        return self.get_progress()
+
+
+
 class PrismaticJoint(Joint):
     '''
     Es un tipo de unión que puede llevar a cabo movimientos de translación con un grado de libertad.
     '''
-    def set_velocity(self, amount):
+    __slots__ = ()
+
+    def set_velocity(self, amount, force = False):
         '''
         Establece la velocidad actual de la unión (en metros / segundo)
         :param amount:
+        :param force: Si es True, el comando se envía aunque la velocidad no haya cambiado.
         :return:
         '''
-        self._set_linear_velocity(amount)
+        self._set_linear_velocity(amount, force)
 
 class SphericalJoint(Joint):
     '''
     Es un tipo de unión que puede realizar movimientos de rotación con tres grados de libertad.
     '''
-    def set_velocity(self, amount):
+    __slots__ = ()
+
+    def set_velocity(self, amount, force = False):
         '''
         Establece la velocidad actual de la unión (en radianes / segundo)
         :param amount:
+        :param force: Si es True, el comando se envía aunque la velocidad no haya cambiado.
         :return:
         '''
-        self._set_angular_velocity(amount)
+        self._set_angular_velocity(amount, force)
 
 
 class RevoluteJoint(Joint):
     '''
     Es un tipo de unión que realiza movimientos de rotación con un grado de libertad.
     '''
-    def set_velocity(self, amount):
+    __slots__ = ()
+
+    def set_velocity(self, amount, force = False):
         '''
         Establece la velocidad actual de la unión (en radianes / segundo)
         :param amount:
+        :param force: Si es True, el comando se envía aunque la velocidad no haya cambiado.
         :return:
         '''
-        self._set_angular_velocity(amount)
+        self._set_angular_velocity(amount, force)
 
 
 
-class Sensor(Object):
+class Sensor(Object, DataStream):
     '''
     Representa un sensor. Puede ser un sensor de proximidad o un sensor de visión.
     La escena debe estar activa (debe haberse invocado scene.simulation.resume()) antes de muestrar
     un sensor.
     '''
+    __slots__ = ('streamed', 'initial_value')
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.streamed = False
@@ -131,6 +547,13 @@ class Sensor(Object):
         '''
         self.streamed = True
 
+    def _stream_command(self, opmode):
+        '''
+        Este método debe enviar el comando del stream del sensor con el modo de operación indicado (se usa para
+        iniciar y detener el stream). Debe ser implementado por las subclases.
+        '''
+        raise NotImplementedError()
+
     def _get_data(self, streamed):
         '''
         Este método debe devolver el valor de medición actual del sensor.
@@ -141,33 +564,30 @@ class Sensor(Object):
         '''
         raise NotImplementedError()
 
-    def get_value(self):
+    def get_value(self, new_only = False):
         ''''
         Este método devuelve la medición actual del sensor.
         La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :param new_only: Si es True, devuelve None si el servidor no ha enviado una nueva medición desde la última
+        lectura (por defecto es False)
         '''
-        simulation = self.client.simulation
-
-        if not simulation.is_running():
-            raise Exception('Error getting sensor data: V-rep simulation is not running')
+        return self._get_stream_value(self._get_data, self.start_streaming, command = self._stream_command,
+                                      new_only = new_only)
 
-        if not self.streamed:
-            data = self._get_data(streamed=False)
-            self.start_streaming()
-            self.initial_value = data
-            value = data
-        else:
-            try:
-                data = self._get_data(streamed=True)
-                value = data
-                if not self.initial_value is None:
-                    self.initial_value = None
-            except Exception as exc:
-                if self.initial_value is None:
-                    raise exc
-                value = self.initial_value
+    def wait_new(self, timeout = None):
+        '''
+        Espera a que el servidor envíe una nueva medición del sensor y la devuelve.
+        :param timeout: Es el tiempo máximo de espera (en segundos). Por defecto None (sin límite)
+        :return: Devuelve la nueva medición, o None si se ha agotado el tiempo de espera.
+        '''
+        return self._wait_new_stream_value(self.get_value, timeout)
 
-        return value
+    def get_timestamp(self):
+        '''
+        Devuelve la marca de tiempo de la última medición del sensor (el tiempo de simulación en milisegundos en el
+        que el servidor la obtuvo), o None si aún no se ha leído el sensor.
+        '''
+        return self._get_sample_time()
 
 
     @property
@@ -181,15 +601,20 @@ class ProximitySensor(Sensor):
     El sensor puede calcular la distancia a un objeto detectado.
     El valor del sensor está en metros. Si no se detecta ningún objeto, el valor del sensor devuelve float('inf')
     '''
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
 
+    def _stream_command(self, opmode):
+        return binds.simxReadProximitySensor(self.client.get_id(), self.get_id(), opmode)
+
     def start_streaming(self):
         super().start_streaming()
 
         try:
-            values = binds.simxReadProximitySensor(self.client.get_id(), self.get_id(), binds.simx_opmode_streaming)
+            values = self._stream_command(binds.simx_opmode_streaming)
             code = values[0]
             if not code in [0, 1]:
                 raise Exception()
@@ -206,6 +631,7 @@ class ProximitySensor(Sensor):
         detected_state, detected_point, detected_object, detected_surface_normal = values[1:]
         if not detected_state:
             return float('inf')
+        from vectormath import Vector3
         detected_point = Vector3(detected_point)
         length = detected_point.length
         return length
@@ -214,12 +640,22 @@ class VisionSensor(Sensor):
     '''
     Representa un sensor de visión.
     '''
+    __slots__ = ('depth_streamed', 'initial_depth')
+    stream_attrs = Sensor.stream_attrs + (('depth_streamed', 'initial_depth'),)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.depth_streamed = False
+        self.initial_depth = None
+
+    def _stream_command(self, opmode):
+        return binds.simxGetVisionSensorImageArray(self.client.get_id(), self.get_id(), 0, opmode)
 
     def start_streaming(self):
         super().start_streaming()
 
         try:
-            values = binds.simxGetVisionSensorImage(self.client.get_id(), self.get_id(), 0, binds.simx_opmode_streaming)
+            values = self._stream_command(binds.simx_opmode_streaming)
             code = values[0]
             if not code in [0, 1]:
                 raise Exception()
@@ -230,32 +666,92 @@ class VisionSensor(Sensor):
     def _get_data(self, streamed):
         opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
 
-        values = binds.simxGetVisionSensorImage(self.client.get_id(), self.get_id(), 0, opmode)
+        values = self._stream_command(opmode)
         code = values[0]
         if code != 0:
             raise Exception('Error getting vision sensor data from client buffer')
         native_size, pixels = values[1:]
-        native_size = tuple(native_size)
-        pixels = np.reshape(np.array(pixels, dtype=np.uint8), (native_size + (3,)))
 
         return pixels
 
 
-    def get_image(self, mode = 'RGB', size = None, resample = Image.NEAREST):
+    def _depth_stream_command(self, opmode):
+        return binds.simxGetVisionSensorDepthBuffer(self.client.get_id(), self.get_id(), opmode)
+
+    def start_depth_streaming(self):
+        '''
+        Igual que start_streaming, pero crea el stream para el buffer de profundidad del sensor.
+        '''
+        self.depth_streamed = True
+
+        try:
+            values = self._depth_stream_command(binds.simx_opmode_streaming)
+            code = values[0]
+            if not code in [0, 1]:
+                raise Exception()
+        except:
+            raise Exception('Error initializing vision sensor depth stream on V-rep remote API server')
+
+
+    def _get_depth_data(self, streamed):
+        opmode = binds.simx_opmode_blocking if not streamed else binds.simx_opmode_buffer
+
+        values = binds.simxGetVisionSensorDepthBufferArray(self.client.get_id(), self.get_id(), opmode)
+        code = values[0]
+        if code != 0:
+            raise Exception('Error getting vision sensor depth data from client buffer')
+        native_size, depth = values[1:]
+
+        return depth
+
+
+    def get_depth(self, new_only = False):
+        '''
+        Devuelve el buffer de profundidad actual del sensor.
+        La simulación debe estar ejecutandose para obtener valores de los sensores.
+        :param new_only: Si es True, devuelve None si el servidor no ha enviado un nuevo buffer de profundidad
+        desde la última lectura (por defecto es False)
+        :return: Devuelve un array numpy de tipo float32 con dimensiones (alto, ancho). Los valores están
+        normalizados en el rango [0, 1] entre los planos de recorte cercano y lejano del sensor.
+        '''
+        return self._get_stream_value(self._get_depth_data, self.start_depth_streaming, 'depth_streamed', 'initial_depth',
+                                      command = self._depth_stream_command, new_only = new_only)
+
+    def wait_new_depth(self, timeout = None):
+        '''
+        Igual que wait_new, pero espera a un nuevo buffer de profundidad.
+        '''
+        return self._wait_new_stream_value(self.get_depth, timeout)
+
+    @property
+    def depth(self):
+        return self.get_depth()
+
+
+    def get_image(self, mode = 'RGB', size = None, resample = None, new_only = False):
         '''
         Interpreta la medición del sensor como una imágen.
         :param mode: Es el modo de la imágen (RGB, 1, L, P, ...). Son modos de imágen definidos por la librería Pillow
         :param size: Es una tupla con la resolución deseada de la imágen. Por defecto es None. Si es None,
         se devolverá la imágen con la resolución original captada en el simulador. Si se indica y la resolución
         deseada es distinta a la original, la imágen será redimensionada al tamaño indicado.
-        :param resample: Es el algoritmo de redimensionamiento de la imágen. Por defecto es NEAREST.
+        :param resample: Es el algoritmo de redimensionamiento de la imágen. Por defecto (None) es NEAREST.
         También puede ser BOX, BILINEAR, BICUBIC, HAMMING y LANCZOS.
+        :param new_only: Si es True, devuelve None si el servidor no ha enviado una nueva imágen desde la última
+        lectura (por defecto es False)
         :return: Devuelve la imágen actual, una instancia de la clase Image de la librería Pillow.
         En caso de error se genera una excepción.
         '''
-        pixels = self.get_value()
+        from PIL import Image
+
+        if resample is None:
+            resample = Image.NEAREST
+
+        pixels = self.get_value(new_only = new_only)
+        if pixels is None:
+            return None
         try:
-            native_size = pixels.shape[0:2]
+            native_size = (pixels.shape[1], pixels.shape[0])
             image = Image.fromarray(pixels, mode='RGB')
 
             if mode != 'RGB':
@@ -276,13 +772,15 @@ class Shape(Object):
     '''
     Representa una figura geométrica de la escena (Esferas, cubos, ...)
     '''
-    pass
+    __slots__ = ()
 
 
 class Light(Object):
     '''
     Representa una fuente de luz de la escena.
     '''
+    __slots__ = ()
+
     @property
     def enabled(self):
         raise NotImplementedError()
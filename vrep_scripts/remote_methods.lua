@@ -15,6 +15,191 @@ function_proxy = function(inInts,inFloats,inStrings,inBuffer)
 end
 
 
+-- Convención de llamada binaria (ver RemoteMethodsProxy.encode_args en vrep.py)
+-- inStrings[1] es el nombre de la función, inStrings[2] la firma de los argumentos: un código por argumento,
+-- 'n' (nil), 'b' (booleano), 'i' (entero), 'f' (número real), 's' (cadena), 'I<n>' (n enteros) o 'F<n>' (n reales).
+-- Los enteros y booleanos van en inInts, los reales en inFloats y las cadenas a partir de inStrings[3]
+-- Los valores devueltos se codifican de la misma forma (la firma es el primer elemento de outStrings). Si no
+-- pueden codificarse en binario (p.ej. tablas anidadas), se devuelven en JSON con la firma 'j'
+-- Los argumentos también pueden enviarse en JSON con la firma 'j' (en la cadena siguiente a la firma)
+
+local function pack_values(...)
+    return {n = select('#', ...), ...}
+end
+
+local function is_integer(value)
+    return value == math.floor(value) and value >= -2147483648 and value <= 2147483647
+end
+
+local function is_number_array(value)
+    local count = 0
+    for key, item in pairs(value) do
+        if type(key) ~= 'number' or type(item) ~= 'number' then
+            return false
+        end
+        count = count + 1
+    end
+    return count == #value
+end
+
+-- Decodifica los argumentos de una llamada a partir de las posiciones indicadas en position (tabla con
+-- los campos i, f y s para inInts, inFloats e inStrings). Actualiza position con las posiciones siguientes
+local function decode_args(signature, ints, floats, strings, position)
+    local args = {n = 0}
+    if signature == 'j' then
+        args = json.decode(strings[position.s])
+        args.n = #args
+        position.s = position.s + 1
+        return args
+    end
+    for code, length in string.gmatch(signature, '(%a)(%d*)') do
+        args.n = args.n + 1
+        if code == 'b' then
+            args[args.n] = ints[position.i] ~= 0
+            position.i = position.i + 1
+        elseif code == 'i' then
+            args[args.n] = ints[position.i]
+            position.i = position.i + 1
+        elseif code == 'f' then
+            args[args.n] = floats[position.f]
+            position.f = position.f + 1
+        elseif code == 's' then
+            args[args.n] = strings[position.s]
+            position.s = position.s + 1
+        elseif code == 'I' then
+            local values = {}
+            for k = 1, tonumber(length) do
+                values[k] = ints[position.i]
+                position.i = position.i + 1
+            end
+            args[args.n] = values
+        elseif code == 'F' then
+            local values = {}
+            for k = 1, tonumber(length) do
+                values[k] = floats[position.f]
+                position.f = position.f + 1
+            end
+            args[args.n] = values
+        end
+    end
+    return args
+end
+
+local function is_encodable(results)
+    for k = 1, results.n do
+        local value = results[k]
+        if type(value) == 'table' and not is_number_array(value) then
+            return false
+        elseif value ~= nil and type(value) ~= 'table' and type(value) ~= 'boolean' and type(value) ~= 'number' and type(value) ~= 'string' then
+            return false
+        end
+    end
+    return true
+end
+
+-- Añade los valores devueltos por una función al final de las tablas ints, floats y strings
+local function encode_results(results, ints, floats, strings)
+    if not is_encodable(results) then
+        table.insert(strings, 'j')
+        table.insert(strings, json.encode({unpack(results, 1, results.n)}))
+        return
+    end
+
+    local signature = ''
+    local signature_index = #strings + 1
+    table.insert(strings, signature)
+    for k = 1, results.n do
+        local value = results[k]
+        local value_type = type(value)
+        if value == nil then
+            signature = signature .. 'n'
+        elseif value_type == 'boolean' then
+            signature = signature .. 'b'
+            table.insert(ints, value and 1 or 0)
+        elseif value_type == 'number' and is_integer(value) then
+            signature = signature .. 'i'
+            table.insert(ints, value)
+        elseif value_type == 'number' then
+            signature = signature .. 'f'
+            table.insert(floats, value)
+        elseif value_type == 'string' then
+            signature = signature .. 's'
+            table.insert(strings, value)
+        else
+            local all_integers = true
+            for _, item in ipairs(value) do
+                all_integers = all_integers and is_integer(item)
+            end
+            signature = signature .. (all_integers and 'I' or 'F') .. #value
+            for _, item in ipairs(value) do
+                table.insert(all_integers and ints or floats, item)
+            end
+        end
+    end
+    strings[signature_index] = signature
+end
+
+binary_proxy = function(inInts,inFloats,inStrings,inBuffer)
+    local function_name = inStrings[1]
+    local function_args = decode_args(inStrings[2], inInts, inFloats, inStrings, {i = 1, f = 1, s = 3})
+    local func = _G[function_name]
+    local ints, floats, strings = {}, {}, {}
+    encode_results(pack_values(func(unpack(function_args, 1, function_args.n))), ints, floats, strings)
+
+    return ints, floats, strings, ''
+end
+
+
+-- Ejecuta una llamada y añade al final de ints, floats y strings 'ok' seguido de los valores devueltos
+-- (como en binary_proxy), o 'e' seguido del mensaje de error si la llamada ha fallado
+local function call_and_encode(function_name, function_args, ints, floats, strings)
+    local func = _G[function_name]
+    local results = pack_values(pcall(func, unpack(function_args, 1, function_args.n)))
+    if results[1] then
+        table.insert(strings, 'ok')
+        encode_results(pack_values(unpack(results, 2, results.n)), ints, floats, strings)
+    else
+        table.insert(strings, 'e')
+        table.insert(strings, tostring(results[2]))
+    end
+end
+
+
+-- Atiende varias llamadas en una única petición. Cada llamada ocupa en inStrings su nombre, su firma y sus
+-- cadenas (ver binary_proxy). Los resultados de cada llamada se codifican con call_and_encode
+batch_proxy = function(inInts,inFloats,inStrings,inBuffer)
+    local ints, floats, strings = {}, {}, {}
+    local position = {i = 1, f = 1, s = 1}
+    while position.s <= #inStrings do
+        local function_name = inStrings[position.s]
+        local signature = inStrings[position.s + 1]
+        position.s = position.s + 2
+        local function_args = decode_args(signature, inInts, inFloats, inStrings, position)
+        call_and_encode(function_name, function_args, ints, floats, strings)
+    end
+
+    return ints, floats, strings, ''
+end
+
+
+-- Atiende una llamada asíncrona. inStrings[1] es el nombre de la señal donde se escribe la respuesta, y a
+-- continuación van el nombre de la función, su firma y sus cadenas (ver binary_proxy). La respuesta (codificada con
+-- call_and_encode) se escribe en la señal como: número de enteros, de reales y de cadenas (int32), los enteros (int32),
+-- los reales (float32) y las cadenas terminadas en '\0'
+async_proxy = function(inInts,inFloats,inStrings,inBuffer)
+    local signal_name = inStrings[1]
+    local function_name = inStrings[2]
+    local position = {i = 1, f = 1, s = 4}
+    local function_args = decode_args(inStrings[3], inInts, inFloats, inStrings, position)
+    local ints, floats, strings = {}, {}, {}
+    call_and_encode(function_name, function_args, ints, floats, strings)
+
+    local reply = simPackInt32Table({#ints, #floats, #strings}) .. simPackInt32Table(ints) .. simPackFloatTable(floats)
+    simSetStringSignal(signal_name, reply .. table.concat(strings, '\0') .. '\0')
+    return {}, {}, {}, ''
+end
+
+
 function get_objects_info()
     object_types = {sim_object_shape_type, sim_object_joint_type,
     sim_object_proximitysensor_type, sim_object_visionsensor_type}
@@ -35,6 +220,121 @@ function get_objects_info()
 end
 
 
+function get_object_type(object_handle)
+    local object_type = simGetObjectType(object_handle)
+    if object_type == sim_object_joint_type then
+        return object_type, simGetJointType(object_handle)
+    end
+    return object_type, -1
+end
+
+
+-- Establece la posición y/o la orientación absolutas de varios objetos. positions y orientations tienen 3 valores
+-- por objeto (x, y, z y ángulos de Euler alpha, beta, gamma); cualquiera de las dos puede ser nil.
+-- Todos los cambios se aplican en el mismo paso de simulación
+function set_poses(handles, positions, orientations)
+    for k, handle in ipairs(handles) do
+        local offset = 3 * (k - 1)
+        if positions then
+            simSetObjectPosition(handle, -1, {positions[offset + 1], positions[offset + 2], positions[offset + 3]})
+        end
+        if orientations then
+            simSetObjectOrientation(handle, -1, {orientations[offset + 1], orientations[offset + 2], orientations[offset + 3]})
+        end
+    end
+end
+
+
+-- Establece la velocidad de varias uniones. velocities tiene un valor por cada unión
+function set_joint_velocities(handles, velocities)
+    for k, handle in ipairs(handles) do
+        simSetJointTargetVelocity(handle, velocities[k])
+    end
+end
+
+
+-- Trayectorias de las uniones (ver Joint.follow_trajectory en vrep_objects.py)
+-- Cada trayectoria tiene los identificadores de sus uniones, los instantes de tiempo (en segundos desde que se
+-- recibe la trayectoria) y las posiciones de todas las uniones en cada instante (una fila por instante).
+-- update_trajectories() debe invocarse en cada paso de simulación desde la sección de actuación del script hijo.
+-- El progreso de cada trayectoria (entre 0 y 1) se escribe en la señal pyvrepclient_trajectory_<id>. Si la
+-- trayectoria se cancela o la reemplaza otra trayectoria, la señal toma el valor trajectory_cancelled
+
+local trajectories = {}
+local next_trajectory_id = 1
+local trajectory_cancelled = -1
+
+local function trajectory_signal_name(trajectory_id)
+    return 'pyvrepclient_trajectory_' .. trajectory_id
+end
+
+function follow_trajectory(handles, times, positions)
+    local trajectory_id = next_trajectory_id
+    next_trajectory_id = next_trajectory_id + 1
+
+    -- Cada unión solo puede seguir una trayectoria
+    for other_id, trajectory in pairs(trajectories) do
+        for _, handle in ipairs(trajectory.handles) do
+            for _, other_handle in ipairs(handles) do
+                if handle == other_handle and trajectories[other_id] then
+                    trajectories[other_id] = nil
+                    simSetFloatSignal(trajectory_signal_name(other_id), trajectory_cancelled)
+                end
+            end
+        end
+    end
+
+    trajectories[trajectory_id] = {handles = handles, times = times, positions = positions,
+                                   start = simGetSimulationTime(), index = 1}
+    simSetFloatSignal(trajectory_signal_name(trajectory_id), 0)
+    return trajectory_id
+end
+
+function stop_trajectory(trajectory_id)
+    if trajectories[trajectory_id] then
+        trajectories[trajectory_id] = nil
+        simSetFloatSignal(trajectory_signal_name(trajectory_id), trajectory_cancelled)
+    end
+end
+
+function update_trajectories()
+    local now = simGetSimulationTime()
+    for trajectory_id, trajectory in pairs(trajectories) do
+        local times, positions, handles = trajectory.times, trajectory.positions, trajectory.handles
+        local count = #times
+        local t = now - trajectory.start
+
+        while trajectory.index < count and times[trajectory.index + 1] <= t do
+            trajectory.index = trajectory.index + 1
+        end
+        local k = trajectory.index
+        local alpha = 0
+        if k < count and times[k + 1] > times[k] then
+            alpha = math.max(0, math.min(1, (t - times[k]) / (times[k + 1] - times[k])))
+        end
+
+        -- Interpolación lineal entre los instantes k y k + 1
+        local joints = #handles
+        for j, handle in ipairs(handles) do
+            local p0 = positions[(k - 1) * joints + j]
+            local p1 = k < count and positions[k * joints + j] or p0
+            simSetJointTargetPosition(handle, p0 + alpha * (p1 - p0))
+        end
+
+        local duration = times[count] - times[1]
+        local progress = 1
+        if duration > 0 then
+            progress = math.max(0, math.min(1, (t - times[1]) / duration))
+        end
+        if t >= times[count] then
+            progress = 1
+            trajectories[trajectory_id] = nil
+        end
+        simSetFloatSignal(trajectory_signal_name(trajectory_id), progress)
+    end
+end
+
+
 -- Funciones para permitir a scripts externos manejar las luces de la escena vrep.
 
 function setLightState(light_handle, enabled)